@@ -0,0 +1,267 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Catalog Benchmark Suite
+
+Times catalog loading and quest queries against synthetic content packs
+(see content_generator.py) and compares the results with stored baselines.
+
+Each case runs in a fresh subprocess so its peak RSS is measured on its own.
+A case is repeated until it has run at least MIN_RUNS times and for at
+least MIN_SECONDS, and its best run is reported. Loading and validation
+report records/sec; the query cases report queries/sec, since an indexed
+query costs O(result) rather than O(catalog). Peak RSS is in KB. A case
+that looks like a regression is re-run up to CONFIRM_RUNS more times and
+keeps its best result, so one run slowed by other load does not fail it.
+
+Results are compared with benchmarks/baselines.json. Throughput depends on
+the machine, so the baselines record a machine fingerprint: on the machine
+that recorded them, a drop or memory growth beyond the tolerance fails the
+run (exit code 1); anywhere else regressions are only reported, unless
+--strict is given. Re-record with --save-baseline on your own machine.
+
+Usage (from the project root):
+    python benchmarks/bench_catalog.py                       # 1k and 100k
+    python benchmarks/bench_catalog.py --sizes 1000 100000 1000000
+    python benchmarks/bench_catalog.py --save-baseline       # record new baselines
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import content_generator
+import game_data
+import quest_handler
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+DEFAULT_SIZES = (1000, 100000)
+CASES = ("load_quests", "load_items", "validate_quest_prerequisites",
+         "get_available_quests", "get_quests_by_level")
+SEED = 163
+MIN_RUNS = 3
+MIN_SECONDS = 1.0
+QUERIES_PER_RUN = 20
+# Extra runs for a case that looks like a regression before failing it
+CONFIRM_RUNS = 2
+
+# ============================================================================
+# BENCHMARK CASES (run inside the worker subprocess)
+# ============================================================================
+
+def run_case(case, quest_file, item_file):
+    """
+    Run one case and return (rate, unit)
+    
+    Loading is not timed for the validation and query cases.
+    """
+    if case == "load_items":
+        return best_rate(lambda: len(game_data.load_items(item_file))), "records/sec"
+    if case == "load_quests":
+        return best_rate(lambda: len(game_data.load_quests(quest_file))), "records/sec"
+
+    quests = game_data.load_quests(quest_file)
+    if case == "validate_quest_prerequisites":
+        def validate():
+            quest_handler.validate_quest_prerequisites(quests)
+            return len(quests)
+        return best_rate(validate), "records/sec"
+
+    # Query cases use the indexed catalog, built outside the timed section
+    catalog = game_data.QuestCatalog(quests).build_indexes()
+    # A player partway through the content: the first 50 quests completed
+    completed = list(quests)[:50]
+    character = {'level': 10, 'active_quests': [], 'completed_quests': completed}
+    def queries():
+        for query in range(QUERIES_PER_RUN):
+            if case == "get_available_quests":
+                quest_handler.get_available_quests(character, catalog)
+            else:
+                quest_handler.get_quests_by_level(catalog, query % 10 + 1, query % 10 + 3)
+        return QUERIES_PER_RUN
+    return best_rate(queries), "queries/sec"
+
+def best_rate(run):
+    """
+    Time run() repeatedly and return the best units/sec
+    
+    run() returns how many units (records or queries) it processed. It is
+    repeated until it ran MIN_RUNS times and for MIN_SECONDS in total, so
+    short cases are not judged on a single noisy timing.
+    """
+    best = 0.0
+    runs = 0
+    total = 0.0
+    while runs < MIN_RUNS or total < MIN_SECONDS:
+        start = time.perf_counter()
+        units = run()
+        seconds = time.perf_counter() - start
+        best = max(best, units / seconds if seconds > 0 else float('inf'))
+        runs += 1
+        total += seconds
+    return best
+
+def worker(case, quest_file, item_file):
+    """Entry point of the subprocess: print one JSON result line"""
+    rate, unit = run_case(case, quest_file, item_file)
+    print(json.dumps({
+        'rate': rate,
+        'unit': unit,
+        # ru_maxrss is reported in KB on Linux
+        'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    }))
+
+def machine_fingerprint():
+    """Describe the machine and interpreter that produced the numbers"""
+    cpu = platform.processor()
+    try:
+        with open("/proc/cpuinfo") as f:
+            cpu = next((line.split(":", 1)[1].strip() for line in f
+                        if line.startswith("model name")), cpu)
+    except OSError:
+        pass
+    return {
+        'cpu': cpu,
+        'cpu_count': os.cpu_count(),
+        'machine': platform.machine(),
+        'python': f"{platform.python_implementation()} {platform.python_version()}",
+    }
+
+# ============================================================================
+# DRIVER
+# ============================================================================
+
+def run_suite(sizes, work_dir):
+    """Generate packs and run every case for every size"""
+    results = {}
+    for size in sizes:
+        generate_pack(size, work_dir)
+        for case in CASES:
+            results[f"{case}@{size}"] = run_worker(case, size, work_dir)
+    return results
+
+def pack_files(size, work_dir):
+    """Return (quest_file, item_file) for one pack size"""
+    return (os.path.join(work_dir, f"quests_{size}.txt"),
+            os.path.join(work_dir, f"items_{size}.txt"))
+
+def generate_pack(size, work_dir):
+    content_generator.generate_content_pack(*pack_files(size, work_dir), size, size, seed=SEED)
+
+def run_worker(case, size, work_dir):
+    """Run one case in a fresh subprocess and return its result"""
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--worker", case, *pack_files(size, work_dir)],
+        capture_output=True, text=True, check=True, cwd=ROOT
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def confirm_regressions(results, baselines, tolerance, work_dir):
+    """
+    Re-run cases that look slower and keep each case's best result
+    
+    A single run can be slowed by other load on the machine; a real
+    regression shows up in every retry.
+    """
+    for attempt in range(CONFIRM_RUNS):
+        suspects = [key for key in results
+                    if compare({key: results[key]}, baselines, tolerance)]
+        if not suspects:
+            break
+        for key in suspects:
+            case, size = key.split("@")
+            retry = run_worker(case, int(size), work_dir)
+            best = results[key]
+            results[key] = {'rate': max(best['rate'], retry['rate']), 'unit': best['unit'],
+                            'peak_rss_kb': min(best['peak_rss_kb'], retry['peak_rss_kb'])}
+    return results
+
+def compare(results, baselines, tolerance):
+    """
+    Compare results with baselines
+    
+    Returns: List of regression messages (empty if none)
+    """
+    regressions = []
+    for key, result in results.items():
+        baseline = baselines.get(key)
+        if baseline is None or baseline.get('unit') != result['unit']:
+            continue
+        if result['rate'] < baseline['rate'] * (1 - tolerance):
+            regressions.append(f"{key}: {result['rate']:.0f} {result['unit']} "
+                               f"(baseline {baseline['rate']:.0f})")
+        if result['peak_rss_kb'] > baseline['peak_rss_kb'] * (1 + tolerance):
+            regressions.append(f"{key}: peak RSS {result['peak_rss_kb']} KB "
+                               f"(baseline {baseline['peak_rss_kb']} KB)")
+    return regressions
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Catalog benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed fractional slowdown / memory growth")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="merge these results into baselines.json")
+    parser.add_argument("--strict", action="store_true",
+                        help="fail on regressions even against another machine's baselines")
+    parser.add_argument("--worker", nargs=3, metavar=("CASE", "QUEST_FILE", "ITEM_FILE"),
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        worker(*args.worker)
+        return 0
+
+    stored = {'machine': None, 'results': {}}
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE) as f:
+            loaded = json.load(f)
+        # Files without a machine fingerprint predate it and are ignored
+        if 'machine' in loaded:
+            stored = loaded
+    machine = machine_fingerprint()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        results = run_suite(args.sizes, work_dir)
+        if not args.save_baseline:
+            results = confirm_regressions(results, stored['results'], args.tolerance, work_dir)
+
+    print(f"{'case':<40} {'rate':>14} {'unit':<12} {'peak RSS (KB)':>14}")
+    for key, result in results.items():
+        print(f"{key:<40} {result['rate']:>14.1f} {result['unit']:<12} "
+              f"{result['peak_rss_kb']:>14}")
+
+    if args.save_baseline:
+        if stored['machine'] != machine:
+            # Numbers from another machine can't be mixed with these
+            stored = {'machine': machine, 'results': {}}
+        stored['results'].update({key: {'rate': round(result['rate'], 1),
+                                        'unit': result['unit'],
+                                        'peak_rss_kb': result['peak_rss_kb']}
+                                  for key, result in results.items()})
+        with open(BASELINE_FILE, "w") as f:
+            json.dump(stored, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baselines saved to {BASELINE_FILE}")
+        return 0
+
+    regressions = compare(results, stored['results'], args.tolerance)
+    same_machine = stored['machine'] == machine
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    if regressions and not (same_machine or args.strict):
+        print("Baselines were recorded on a different machine; not failing the run. "
+              "Use --save-baseline to record local baselines, or --strict to fail anyway.")
+        return 0
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,55 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Character Memory Benchmark
+
+Compares the memory used by plain dict characters against the slotted
+Character class returned by create_character, measured with tracemalloc.
+
+Run from the project root: python benchmarks/bench_characters.py [count]
+"""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+def make_dict(index):
+    """Build one character dictionary like the old create_character did"""
+    return {
+        "name": "Hero", "class": "Warrior", "level": 1, "health": 120,
+        "max_health": 120, "strength": 15, "magic": 5, "experience": 0,
+        "gold": 100, "inventory": [], "active_quests": [], "completed_quests": []
+    }
+
+def make_character(index):
+    """Build one slotted Character with the same values"""
+    return character_manager.Character("Hero", "Warrior", 1, 120, 120, 15, 5, 0, 100,
+                                       [], [], [])
+
+def measure(build, count):
+    """Return the bytes allocated per character by build(index) for count characters"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    characters = [build(index) for index in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del characters
+    return (after - before) / count
+
+def main(count=1000000):
+    print(f"=== CHARACTER MEMORY BENCHMARK ({count} characters) ===")
+    rows = [
+        ("dict", measure(make_dict, count)),
+        ("Character", measure(make_character, count)),
+    ]
+    for label, per_character in rows:
+        total_mb = per_character * count / 1e6
+        print(f"{label:<10} {per_character:8.1f} bytes/character  {total_mb:8.1f} MB total")
+    print(f"Saving: {rows[0][1] - rows[1][1]:.1f} bytes/character "
+          f"({(rows[0][1] - rows[1][1]) * count / 1e6:.1f} MB)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
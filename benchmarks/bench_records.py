@@ -0,0 +1,78 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Record Memory Benchmark
+
+Compares the memory used by plain dict quest/item records against the
+slotted Quest/Item record types, measured with tracemalloc.
+
+Run from the project root: python benchmarks/bench_records.py [count]
+"""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+
+def make_quest(index):
+    """Build one quest dictionary like parse_quest_block would"""
+    return {
+        'quest_id': f"quest_{index}",
+        'title': f"Quest {index}",
+        'description': "Defeat the monsters troubling the village",
+        'reward_xp': 100 + index % 500,
+        'reward_gold': 50 + index % 200,
+        'required_level': 1 + index % 50,
+        'prerequisite': "NONE" if index == 0 else f"quest_{index - 1}"
+    }
+
+def make_item(index):
+    """Build one item dictionary like parse_item_block would"""
+    return {
+        'item_id': f"item_{index}",
+        'name': f"Item {index}",
+        'type': ('weapon', 'armor', 'consumable')[index % 3],
+        'effect': f"strength:{index % 20}",
+        'cost': 10 + index % 1000,
+        'description': "A useful piece of equipment",
+        'effects': (("strength", index % 20),)
+    }
+
+def measure(build, count):
+    """
+    Return the bytes allocated per record by build(index) for count records
+    
+    The same source dictionaries are used for both shapes so that the
+    shared strings are not counted against either one.
+    """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    records = [build(index) for index in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    total = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del records
+    return total / count
+
+def main(count=100000):
+    print(f"=== RECORD MEMORY BENCHMARK ({count} records) ===")
+    quest_sources = [make_quest(index) for index in range(count)]
+    item_sources = [make_item(index) for index in range(count)]
+
+    rows = [
+        ("quest dict", measure(lambda i: dict(quest_sources[i]), count)),
+        ("Quest record", measure(lambda i: game_data.Quest.from_dict(quest_sources[i]), count)),
+        ("item dict", measure(lambda i: dict(item_sources[i]), count)),
+        ("Item record", measure(lambda i: game_data.Item.from_dict(item_sources[i]), count)),
+    ]
+    for label, per_record in rows:
+        print(f"{label:<14} {per_record:8.1f} bytes/record")
+
+    print(f"Quest saving: {rows[0][1] - rows[1][1]:.1f} bytes/record")
+    print(f"Item saving:  {rows[2][1] - rows[3][1]:.1f} bytes/record")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
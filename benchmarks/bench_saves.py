@@ -0,0 +1,56 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Save Format Benchmark
+
+Compares the legacy text save format against the versioned binary save
+format for the same characters: bytes per save and decode time, without
+touching the disk.
+
+Run from the project root: python benchmarks/bench_saves.py [count]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+def make_character(index):
+    """Build one character dictionary like create_character would, with progress"""
+    character = character_manager.create_character(f"Hero{index}", "Warrior")
+    character['level'] = 1 + index % 50
+    character['gold'] = index % 5000
+    character['inventory'] = [f"item_{index % 97}", f"item_{index % 89}", "health_potion"]
+    character['active_quests'] = [f"quest_{index % 31}", f"quest_{index % 37}"]
+    character['completed_quests'] = [f"quest_{n}" for n in range(index % 10 + 2)]
+    return character
+
+def time_decode(decode, payloads):
+    """Return total seconds taken to decode every payload"""
+    start = time.perf_counter()
+    for name, data in payloads:
+        decode(data, name)
+    return time.perf_counter() - start
+
+def main(count=100000):
+    print(f"=== SAVE FORMAT BENCHMARK ({count} saves) ===")
+    characters = [make_character(index) for index in range(count)]
+    text_saves = [(c['name'], character_manager._serialize_character(c).encode("utf-8"))
+                  for c in characters]
+    binary_saves = [(c['name'], character_manager.encode_binary_save(c))
+                    for c in characters]
+
+    text_time = time_decode(character_manager._parse_text_save, text_saves)
+    binary_time = time_decode(character_manager.decode_binary_save, binary_saves)
+
+    text_size = sum(len(data) for _, data in text_saves) / count
+    binary_size = sum(len(data) for _, data in binary_saves) / count
+    print(f"text   {text_time:8.3f}s  {text_size:6.0f} bytes/save")
+    print(f"binary {binary_time:8.3f}s  {binary_size:6.0f} bytes/save")
+    print(f"Size:    {binary_size / text_size:.2f}x of text")
+    print(f"Speedup: {text_time / binary_time:.2f}x")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,52 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Character Spawn Benchmark
+
+Times creating characters one at a time with create_character against
+one create_characters batch built from the class templates, and the same
+batch with the caller pausing the cyclic garbage collector around it.
+
+Run from the project root: python benchmarks/bench_spawn.py [count]
+"""
+
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+def main(count=1000000):
+    print(f"=== CHARACTER SPAWN BENCHMARK ({count} characters) ===")
+    classes = character_manager.VALID_CHARACTER_CLASSES
+    specs = [(f"Npc{index}", classes[index % len(classes)]) for index in range(count)]
+
+    start = time.perf_counter()
+    single = [character_manager.create_character(name, char_class) for name, char_class in specs]
+    single_time = time.perf_counter() - start
+    del single
+
+    start = time.perf_counter()
+    batch = character_manager.create_characters(specs)
+    batch_time = time.perf_counter() - start
+    del batch
+
+    # Pausing the collector is the caller's choice: it affects every thread
+    start = time.perf_counter()
+    gc.disable()
+    try:
+        batch = character_manager.create_characters(specs)
+    finally:
+        gc.enable()
+    paused_time = time.perf_counter() - start
+    del batch
+
+    print(f"create_character loop  {single_time:7.3f}s")
+    print(f"create_characters      {batch_time:7.3f}s")
+    print(f"  with gc paused       {paused_time:7.3f}s")
+    print(f"Speedup: {single_time / batch_time:.2f}x ({single_time / paused_time:.2f}x with gc paused)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,184 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Catalog Analytics Module
+
+Columnar, NumPy-backed view of the item catalog for pricing analytics.
+Filters, sorts and aggregates run as vectorized array operations instead of
+Python loops over all_items.values().
+
+NumPy is optional: the rest of the game does not need it, and
+build_item_columns raises ImportError with a clear message when it is missing.
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Item types in the order used for type codes
+ITEM_TYPES = ('weapon', 'armor', 'consumable')
+
+def build_item_columns(item_data_dict):
+    """
+    Build a columnar view of an item catalog
+    
+    Args:
+        item_data_dict: Dictionary of items, e.g. from game_data.load_items()
+    
+    Returns: ItemColumns
+    Raises: ImportError if NumPy is not installed
+    """
+    if np is None:
+        raise ImportError("catalog_analytics requires NumPy (pip install numpy)")
+
+    count = len(item_data_dict)
+    item_ids = np.empty(count, dtype=object)
+    costs = np.empty(count, dtype=np.int64)
+    type_codes = np.empty(count, dtype=np.int8)
+    stat_codes = np.empty(count, dtype=np.int16)
+    effect_values = np.empty(count, dtype=np.int64)
+
+    type_lookup = {item_type: code for code, item_type in enumerate(ITEM_TYPES)}
+    stat_names = []
+    stat_lookup = {}
+
+    for position, (item_id, item) in enumerate(item_data_dict.items()):
+        stat_name, value = _first_effect(item)
+        if stat_name not in stat_lookup:
+            stat_lookup[stat_name] = len(stat_names)
+            stat_names.append(stat_name)
+        item_ids[position] = item_id
+        costs[position] = item['cost']
+        type_codes[position] = type_lookup.get(item['type'], -1)
+        stat_codes[position] = stat_lookup[stat_name]
+        effect_values[position] = value
+
+    return ItemColumns(item_ids, costs, type_codes, stat_codes, effect_values, stat_names)
+
+def _first_effect(item):
+    """Return the (stat, value) of an item's first effect, or ("", 0)"""
+    effects = item.get('effects')
+    if effects:
+        return effects[0]
+    effect = item.get('effect', '')
+    if ':' not in effect:
+        return "", 0
+    stat_name, value = effect.split(',')[0].split(':', 1)
+    try:
+        return stat_name.strip(), int(value)
+    except ValueError:
+        return stat_name.strip(), 0
+
+class ItemColumns:
+    """
+    Parallel NumPy arrays over an item catalog
+    
+    Attributes:
+        item_ids: object array of item IDs
+        costs: int64 array of costs
+        type_codes: int8 array, index into ITEM_TYPES (-1 for unknown)
+        stat_codes: int16 array, index into stat_names
+        effect_values: int64 array of effect amounts
+        stat_names: list of effect stat names seen in the catalog
+    """
+
+    def __init__(self, item_ids, costs, type_codes, stat_codes, effect_values, stat_names):
+        self.item_ids = item_ids
+        self.costs = costs
+        self.type_codes = type_codes
+        self.stat_codes = stat_codes
+        self.effect_values = effect_values
+        self.stat_names = stat_names
+
+    def __len__(self):
+        return len(self.item_ids)
+
+    def mask(self, item_type=None, min_cost=None, max_cost=None,
+             effect_stat=None, min_effect=None):
+        """
+        Build a boolean mask selecting items that match every given filter
+        
+        Returns: NumPy bool array the length of the catalog
+        """
+        selected = np.ones(len(self), dtype=bool)
+        if item_type is not None:
+            if item_type not in ITEM_TYPES:
+                return np.zeros(len(self), dtype=bool)
+            selected &= self.type_codes == ITEM_TYPES.index(item_type)
+        if min_cost is not None:
+            selected &= self.costs >= min_cost
+        if max_cost is not None:
+            selected &= self.costs <= max_cost
+        if effect_stat is not None:
+            if effect_stat not in self.stat_names:
+                return np.zeros(len(self), dtype=bool)
+            selected &= self.stat_codes == self.stat_names.index(effect_stat)
+        if min_effect is not None:
+            selected &= self.effect_values >= min_effect
+        return selected
+
+    def filter(self, **filters):
+        """
+        Return the IDs of items matching the filters accepted by mask()
+        
+        Example: columns.filter(item_type="weapon", max_cost=200)
+        """
+        return self.item_ids[self.mask(**filters)].tolist()
+
+    def sort_by(self, column="cost", descending=False, limit=None, **filters):
+        """
+        Return item IDs sorted by "cost" or "effect", optionally filtered
+        
+        Raises: ValueError for an unknown column
+        """
+        if column == "cost":
+            values = self.costs
+        elif column == "effect":
+            values = self.effect_values
+        else:
+            raise ValueError(f"Cannot sort by column: {column}")
+
+        positions = np.flatnonzero(self.mask(**filters))
+        order = np.argsort(values[positions], kind="stable")
+        if descending:
+            order = order[::-1]
+        if limit is not None:
+            order = order[:limit]
+        return self.item_ids[positions[order]].tolist()
+
+    def cost_summary(self, **filters):
+        """
+        Aggregate the cost column over matching items
+        
+        Returns: Dictionary with count, total, min, max and mean cost
+        """
+        costs = self.costs[self.mask(**filters)]
+        if len(costs) == 0:
+            return {'count': 0, 'total': 0, 'min': None, 'max': None, 'mean': None}
+        return {
+            'count': int(len(costs)),
+            'total': int(costs.sum()),
+            'min': int(costs.min()),
+            'max': int(costs.max()),
+            'mean': float(costs.mean())
+        }
+
+    def cost_by_type(self):
+        """
+        Total and mean cost per item type in one vectorized pass
+        
+        Returns: Dictionary {item_type: {'count', 'total', 'mean'}}
+        """
+        known = self.type_codes >= 0
+        codes = self.type_codes[known].astype(np.intp)
+        counts = np.bincount(codes, minlength=len(ITEM_TYPES))
+        totals = np.bincount(codes, weights=self.costs[known], minlength=len(ITEM_TYPES))
+        summary = {}
+        for code, item_type in enumerate(ITEM_TYPES):
+            count = int(counts[code])
+            summary[item_type] = {
+                'count': count,
+                'total': int(totals[code]),
+                'mean': float(totals[code] / count) if count else None
+            }
+        return summary
@@ -10,112 +10,500 @@ This module handles character creation, loading, and saving.
 """
 
 import os
+import sqlite3
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from collections import Counter, OrderedDict
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from custom_exceptions import (
     InvalidCharacterClassError,
     CharacterNotFoundError,
     SaveFileCorruptedError,
     InvalidSaveDataError,
-    CharacterDeadError
+    CharacterDeadError,
+    SaveFileWriteError,
+    GameError
 )
 
+# Save file formats: "binary" (current) or "text" (legacy key:value lines)
+DEFAULT_SAVE_FORMAT = "binary"
+SAVE_SUFFIXES = {"binary": "_save.bin", "text": "_save.txt"}
+
+# Binary save layout: a header, then the sections in order
+#   fields   one byte per field: type tag in the low 3 bits, and in the high
+#            5 bits the key's index in CHARACTER_FIELDS (or _EXTRA_FIELD)
+#   counts   u16 per list field: its number of elements
+#   numbers  one value per int or bool, all in the narrowest width that
+#            holds them (i8, i16, i32 or i64, recorded in the header)
+#   text     str/float values and the names of keys outside
+#            CHARACTER_FIELDS, NUL-separated UTF-8
+# Known keys cost one byte and small stats one byte each, so a save is about
+# a third of the size of its text form. Each section is unpacked with a
+# single call, so decoding is a slice per field rather than parsing and
+# guessing types line by line.
+SAVE_MAGIC = b"QCSAVE"
+SAVE_VERSION = 2
+# magic, version, number width, field count, number count, CRC32 of the body
+_SAVE_HEADER = struct.Struct("<6sBBHHI")
+# Version 1 saves (full key names, u32 counts, i64 numbers) still load
+_SAVE_HEADER_V1 = struct.Struct("<6sBHII")
+_NUMBER_WIDTHS = "bhiq"
+# Field ID for keys outside CHARACTER_FIELDS; their names go in the text section
+_EXTRA_FIELD = 31
+(_TAG_NONE, _TAG_INT, _TAG_STR, _TAG_BOOL, _TAG_FLOAT,
+ _TAG_INT_LIST, _TAG_STR_LIST, _TAG_FLOAT_LIST) = range(8)
+_LIST_TAGS = {int: _TAG_INT_LIST, str: _TAG_STR_LIST, float: _TAG_FLOAT_LIST}
+
+# Every save directory keeps an append-only manifest of
+# "S<TAB>name<TAB>class<TAB>level<TAB>saved_at" and "D<TAB>name" lines, so
+# listing never has to list or open the save files
+MANIFEST_FILENAME = "manifest.tsv"
+MANIFEST_FIELDS = ("name", "class", "level", "saved_at")
+# Rewrite the manifest once it holds this many more lines than live saves
+MANIFEST_COMPACT_SLACK = 1024
+
+# Incremental saves append field-level deltas to {name}_save.journal. The
+# journal header holds the CRC32 of the snapshot it applies to, so a journal
+# left behind by a crash during compaction is ignored rather than replayed
+# twice. Each record is a u32 length followed by a delta encoded like a
+# binary save, with keys "=field" (set), "+field"/"-field" (list items added
+# or removed) and "!field" (field deleted).
+JOURNAL_SUFFIX = "_save.journal"
+JOURNAL_MAGIC = b"QCJRNL"
+_JOURNAL_HEADER = struct.Struct("<6sI")
+_JOURNAL_RECORD = struct.Struct("<I")
+# Fold the journal into a new snapshot after this many deltas
+JOURNAL_COMPACT_RECORDS = 64
+
+# Write-behind autosave: flush dirty characters this often (seconds), or as
+# soon as this many different characters are waiting
+AUTOSAVE_INTERVAL = 5.0
+AUTOSAVE_MAX_DIRTY = 32
+
+# Default number of characters kept by enable_load_cache()
+LOAD_CACHE_SIZE = 1024
+
+# Thread pool size for load_characters/save_characters
+BULK_IO_WORKERS = 8
+
+# A save_directory ending in one of these is a SQLite database, not a folder
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+# ============================================================================
+# CHARACTER RECORD
+# ============================================================================
+
+# Character keys in save order, and the slot that holds each one ("class"
+# is a Python keyword, so it is stored as character_class)
+CHARACTER_FIELDS = ("name", "class", "level", "health", "max_health", "strength",
+                    "magic", "experience", "gold", "inventory", "active_quests",
+                    "completed_quests")
+_CHARACTER_SLOTS = {field: "character_class" if field == "class" else field
+                    for field in CHARACTER_FIELDS}
+# Binary saves store these keys as their index instead of their name
+_FIELD_IDS = {field: index for index, field in enumerate(CHARACTER_FIELDS)}
+# Decoding table: field byte -> (key, or None for an extra field, type tag)
+_FIELD_BYTES = [(CHARACTER_FIELDS[byte >> 3] if byte >> 3 < len(CHARACTER_FIELDS) else None,
+                 byte & 7) for byte in range(256)]
+# Every field byte that is not a list, so deleting them leaves one byte per list
+_NON_LIST_BYTES = bytes(byte for byte in range(256) if byte & 7 < _TAG_INT_LIST)
+
+class Character(MutableMapping):
+    """
+    Slotted character with the same interface as a character dictionary
+    
+    The twelve standard fields live in __slots__ instead of a per-character
+    dict, which matters when millions of characters are alive at once.
+    Other keys (e.g. equipped_weapon) go into a small overflow dict that is
+    only created when needed. Supports character['key'] reads and writes,
+    get(), 'key' in character, del, keys/items/values, equality with plain
+    dicts, and attribute access (character.gold).
+    """
+    __slots__ = tuple(_CHARACTER_SLOTS.values()) + ('_extra',)
+
+    def __init__(self, name, character_class, level, health, max_health, strength,
+                 magic, experience, gold, inventory, active_quests, completed_quests):
+        # Plain assignments; this runs once per character in create_characters
+        self.name = name
+        self.character_class = character_class
+        self.level = level
+        self.health = health
+        self.max_health = max_health
+        self.strength = strength
+        self.magic = magic
+        self.experience = experience
+        self.gold = gold
+        self.inventory = inventory
+        self.active_quests = active_quests
+        self.completed_quests = completed_quests
+        self._extra = None
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a Character from any character mapping; missing fields stay unset"""
+        character = cls.__new__(cls)
+        character._extra = None
+        for key, value in data.items():
+            character[key] = value
+        return character
+
+    def __getitem__(self, key):
+        slot = _CHARACTER_SLOTS.get(key)
+        if slot is not None:
+            try:
+                return getattr(self, slot)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        slot = _CHARACTER_SLOTS.get(key)
+        if slot is not None:
+            setattr(self, slot, value)
+        elif self._extra is None:
+            self._extra = {key: value}
+        else:
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        slot = _CHARACTER_SLOTS.get(key)
+        try:
+            if slot is not None:
+                delattr(self, slot)
+            elif self._extra:
+                del self._extra[key]
+            else:
+                raise KeyError(key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        slot = _CHARACTER_SLOTS.get(key)
+        if slot is not None:
+            return hasattr(self, slot)
+        return bool(self._extra and key in self._extra)
+
+    def __iter__(self):
+        for key, slot in _CHARACTER_SLOTS.items():
+            if hasattr(self, slot):
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __reduce__(self):
+        return (_rebuild_character, (self.copy(),))
+
+    def copy(self):
+        """Return a plain dict copy of the character"""
+        return dict(self.items())
+
+    def to_dict(self):
+        """Return the character as a plain dict"""
+        return self.copy()
+
+    def __repr__(self):
+        return f"Character({self.copy()!r})"
+
+def _rebuild_character(data):
+    """Pickle helper for Character"""
+    return Character.from_dict(data)
+
 # ============================================================================
 # CHARACTER MANAGEMENT FUNCTIONS
 # ============================================================================
+
+# Starting (health, strength, magic) for each playable class, built once
+CLASS_TEMPLATES = {
+    "Warrior": (120, 15, 5),
+    "Mage":    (80,  8,  20),
+    "Rogue":   (90,  12, 10),
+    "Cleric":  (100, 10, 15)
+}
+VALID_CHARACTER_CLASSES = tuple(CLASS_TEMPLATES)
+
 def create_character(name, character_class):
 
     
     # Validate character_class first
-    valid_char_classes = ["Warrior", "Mage", "Rogue", "Cleric"]
-    
     # Raise InvalidCharacterClassError if class not in valid list
-    if character_class not in valid_char_classes:
+    stats = CLASS_TEMPLATES.get(character_class)
+    if stats is None:
         raise InvalidCharacterClassError(f"{character_class} is not an available class.")
-    
-    base_stats = {
-        "Warrior": {"health": 120, "strength": 15, "magic": 5}, 
-        "Mage":    {"health": 80,  "strength": 8,  "magic": 20},
-        "Rogue":   {"health": 90,  "strength": 12, "magic": 10},
-        "Cleric":  {"health": 100, "strength": 10, "magic": 15}
-    }
 
-    stats = base_stats[character_class]
-
-    return {
-        "name": name,
-        "class": character_class,
-        "level": 1,
-        "health": stats["health"],
-        "max_health": stats["health"],
-        "strength": stats["strength"],
-        "magic": stats["magic"],
-        "experience": 0, 
-        "gold": 100,
+    health, strength, magic = stats
+    # Same fields, in CHARACTER_FIELDS order, as the old dictionary
+    return Character(
+        name,
+        character_class,
+        1,                  # level
+        health,
+        health,             # max_health
+        strength,
+        magic,
+        0,                  # experience
+        100,                # gold
         # Empty
-        "inventory": [], 
-        "active_quests": [],
-        "completed_quests": [] 
-    }
+        [],                 # inventory
+        [],                 # active_quests
+        []                  # completed_quests
+    )
 
+def create_characters(specs):
+    """
+    Create many characters at once from class templates
+    
+    Classes are validated for the whole batch before anything is built.
+    Garbage collection is left alone. Each character allocates four
+    containers, so very large batches trigger collections that walk every
+    character made so far; a caller spawning millions at once may pause
+    the collector around the call (see benchmarks/bench_spawn.py).
+    
+    Args:
+        specs: Iterable of (name, character_class) pairs
+    
+    Returns: List of Character objects, in spec order
+    Raises: InvalidCharacterClassError listing every bad (index, name, class)
+    """
+    specs = list(specs)
+    templates = CLASS_TEMPLATES
+    if not {character_class for _, character_class in specs} <= templates.keys():
+        invalid = [f"#{index} {name!r}: {character_class!r}"
+                   for index, (name, character_class) in enumerate(specs)
+                   if character_class not in templates]
+        raise InvalidCharacterClassError(
+            f"{len(invalid)} invalid character classes: {', '.join(invalid)}")
+
+    characters = []
+    for name, character_class in specs:
+        health, strength, magic = templates[character_class]
+        characters.append(Character(name, character_class, 1, health, health, strength,
+                                    magic, 0, 100, [], [], []))
+    return characters
 
 
-def save_character(character, save_directory="data/save_games"):
+
+def save_character(character, save_directory="data/save_games", fsync=False,
+                   save_format=DEFAULT_SAVE_FORMAT):
+    """
+    Save character to file atomically
+    
+    The whole save is serialized into one buffer, written to a temp file in
+    the same directory and moved into place with os.replace, so a crash
+    mid-save leaves the previous save intact instead of a truncated file.
+    
+    Args:
+        character: Character dictionary
+        save_directory: Directory for save files, or a SQLite database path
+        fsync: Also flush the file and directory to disk before returning
+        save_format: "binary" ({name}_save.bin) or legacy "text" ({name}_save.txt)
+    
+    Returns: True if saved successfully
+    Raises: SaveFileWriteError if the save could not be written
+    """
     # AI Use. Google Gemini was used to handle I/O errors properly
-    # TODO: Implement save functionality
-    # Handle any file I/O errors appropriately
+    if is_sqlite_store(save_directory):
+        return get_character_store(save_directory).save(character)
+
+    _write_snapshot(character, save_directory, fsync, save_format)
+    return True
+
+def _write_snapshot(character, save_directory, fsync=False, save_format=DEFAULT_SAVE_FORMAT):
+    """Write a full save file, drop any journal; returns the bytes written"""
+    # Reject names the manifest can't hold before any file is written
+    _manifest_save_line(character)
+    if save_format == "binary":
+        data = encode_binary_save(character)
+    elif save_format == "text":
+        data = _serialize_character(character).encode("utf-8")
+    else:
+        raise ValueError(f"Unknown save format: {save_format}")
+
+    filepath = _save_path(character['name'], save_directory, save_format)
+    _atomic_write(filepath, data, fsync)
+
+    # Remove the save in the other format so it can't shadow this one
+    for other_format in SAVE_SUFFIXES:
+        if other_format != save_format:
+            _remove_save_file(_save_path(character['name'], save_directory, other_format))
+    _discard_journal(character['name'], save_directory)
+    _invalidate_load_cache(character['name'], save_directory)
+    _get_manifest(save_directory).record_save(character)
+    return data
+
+def _remove_save_file(filepath):
+    """
+    Remove a save or journal file if it exists
     
-    # Create save_directory if it doesn't exist
-    os.makedirs(save_directory, exist_ok=True)
+    Raises: SaveFileWriteError if it exists but can't be removed
+    """
+    try:
+        os.remove(filepath)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        raise SaveFileWriteError(f"Could not remove save file {filepath}: {e}")
+
+def _save_path(character_name, save_directory, save_format):
+    """Return the save file path for a character in one format"""
+    return os.path.join(save_directory, f"{character_name}{SAVE_SUFFIXES[save_format]}")
+
+def _serialize_character(character):
+    """Build the key:value save text for a character in one string"""
+    lines = []
+    for key, value in character.items():
+        # Lists should be saved as comma-separated values
+        if isinstance(value, list):
+            value = ",".join(value)
+        lines.append(f"{key}:{value}\n")
+    return "".join(lines)
+
+def _new_file_mode():
+    """Return the mode open() would give a new file: 0o666 minus the umask"""
+    # os.umask can only be read by setting it, so restore it straight away
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
 
-    filepath = os.path.join(save_directory, f"{character['name']}_save.txt")
+# Read once: os.umask is process-wide, so calling it from the autosave thread
+# could briefly change the mode of files other threads create
+_NEW_FILE_MODE = _new_file_mode()
 
+def _atomic_write(filepath, data, fsync=False):
+    """
+    Write bytes to filepath via a temp file and os.replace
+    
+    The file keeps the mode of the file it replaces, or gets the mode a
+    plain open() would give it (mkstemp creates temp files as 0600).
+    
+    Raises: SaveFileWriteError on any I/O error (the temp file is removed)
+    """
+    save_directory = os.path.dirname(filepath) or "."
+    temp_path = None
     try:
-        with open(filepath, "w") as f:
-            for key, value in character.items():
-                # Lists should be saved as comma-separated values
-                if isinstance(value, list):
-                    value = ",".join(value)
-                # Write the line as key:value
-                f.write(f"{key}:{value}\n")
-        return True
-    except Exception as e:
-        # Could log e here if needed
-        return False
+        # Create save_directory if it doesn't exist
+        os.makedirs(save_directory, exist_ok=True)
+        # Hidden ".tmp" name so a leftover temp file is never listed as a save
+        fd, temp_path = tempfile.mkstemp(dir=save_directory,
+                                         prefix=f".{os.path.basename(filepath)}.",
+                                         suffix=".tmp")
+        try:
+            mode = os.stat(filepath).st_mode & 0o7777
+        except FileNotFoundError:
+            mode = _NEW_FILE_MODE
+        with os.fdopen(fd, "wb") as f:
+            if hasattr(os, "fchmod"):
+                os.fchmod(f.fileno(), mode)
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, filepath)
+        temp_path = None
+        if fsync and hasattr(os, "O_DIRECTORY"):
+            # Make the rename itself durable
+            dir_fd = os.open(save_directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+    except OSError as e:
+        raise SaveFileWriteError(f"Could not write save file {filepath}: {e}")
+    finally:
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
     
 def load_character(character_name, save_directory="data/save_games"):
-
+    """
+    Load character from a binary save, or a legacy text save
     
-    # TODO: Implement load functionality
+    Returns: Character dictionary
+    Raises:
+        CharacterNotFoundError if no save file exists
+        SaveFileCorruptedError if a binary save is truncated or damaged
+        InvalidSaveDataError if the save data can't be parsed
+    """
+    if is_sqlite_store(save_directory):
+        return get_character_store(save_directory).load(character_name)
+
+    cache = _load_cache
+    if cache is None:
+        return _load_character_files(character_name, save_directory)
 
-    filepath = os.path.join(save_directory, f"{character_name}_save.txt")
+    # A hit costs three stats instead of opening and decoding the save
+    key = (os.path.abspath(save_directory), character_name)
+    validity = tuple(_stat_key(path) for path in (
+        _save_path(character_name, save_directory, "binary"),
+        _save_path(character_name, save_directory, "text"),
+        _journal_path(character_name, save_directory)))
+    character = cache.get(key, validity)
+    if character is None:
+        character = _load_character_files(character_name, save_directory)
+        cache.put(key, validity, character)
+    return character
+
+def _load_character_files(character_name, save_directory):
+    """Read and decode a character's save file and journal"""
+    filepath = _save_path(character_name, save_directory, "binary")
+    if not os.path.exists(filepath):
+        filepath = _save_path(character_name, save_directory, "text")
 
     # Check if the file exists
     if not os.path.exists(filepath):
         raise CharacterNotFoundError(f"Save file not found for: {character_name}")
 
-    character = {}
     # Try to read file → SaveFileCorruptedError
     try:
-        with open(filepath, "r") as f:
-            for line in f:
-                # Skips invalid lines
-                if ":" not in line:
-                    continue
+        with open(filepath, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        raise SaveFileCorruptedError(f"Could not read save file for {character_name}: {e}")
 
-                # Split at the first colon into key and value
-                key, value = line.strip().split(":", 1)
+    if data.startswith(SAVE_MAGIC):
+        character = decode_binary_save(data, character_name)
+    else:
+        character = _parse_text_save(data, character_name)
+    character = _replay_journal(character, character_name, data, save_directory)
+    return Character.from_dict(character)
 
-                # Strip extra whitespace from key and value
-                key = key.strip()
-                value = value.strip()
-                # Parse comma-separated lists back into Python lists
-                if "," in value:
-                    value = value.split(",")
-                # Convert numeric strings to integers
-                elif value.isdigit():
-                    value = int(value)
+def _parse_text_save(data, character_name):
+    """
+    Parse the legacy key:value text save format
+    
+    Types are guessed per value: comma-separated values become lists and
+    digit strings become ints. The binary format avoids these guesses.
+    """
+    character = {}
+    try:
+        for line in data.decode("utf-8").splitlines():
+            # Skips invalid lines
+            if ":" not in line:
+                continue
 
-                # Store in character dictionary
-                character[key] = value
+            # Split at the first colon into key and value
+            key, value = line.strip().split(":", 1)
+
+            # Strip extra whitespace from key and value
+            key = key.strip()
+            value = value.strip()
+            # Parse comma-separated lists back into Python lists
+            if "," in value:
+                value = value.split(",")
+            # Convert numeric strings to integers
+            elif value.isdigit():
+                value = int(value)
+
+            # Store in character dictionary
+            character[key] = value
 
     except Exception as e:
          # Validate data format → InvalidSaveDataError
@@ -123,40 +511,1113 @@ def load_character(character_name, save_directory="data/save_games"):
 
     return character
 
-def list_saved_characters(save_directory="data/save_games"):
+def encode_binary_save(character):
+    """
+    Encode a character into the versioned binary save format
+    
+    Supports None, bool, int, float and str values, and lists whose
+    elements are all int, all str or all float.
+    
+    Returns: bytes
+    Raises: InvalidSaveDataError for values the format can't hold
+    """
+    fields = bytearray()
+    counts = []
+    numbers = []
+    strings = []
+    for key, value in character.items():
+        field_id = _FIELD_IDS.get(key, _EXTRA_FIELD)
+        if field_id == _EXTRA_FIELD:
+            strings.append(key)
+        if value is None:
+            fields.append(field_id << 3 | _TAG_NONE)
+            continue
+        if isinstance(value, list):
+            kinds = {type(element) for element in value} or {str}
+            if len(kinds) != 1 or not kinds <= _LIST_TAGS.keys():
+                raise InvalidSaveDataError(
+                    f"Cannot save field '{key}': lists must be all int, all str or all float")
+            tag = _LIST_TAGS[kinds.pop()]
+            counts.append(len(value))
+            values = value
+        elif type(value) in (int, bool, str, float):
+            tag = {int: _TAG_INT, bool: _TAG_BOOL, str: _TAG_STR,
+                   float: _TAG_FLOAT}[type(value)]
+            values = (value,)
+        else:
+            raise InvalidSaveDataError(
+                f"Cannot save field '{key}' of type {type(value).__name__}")
+
+        fields.append(field_id << 3 | tag)
+        if tag in (_TAG_INT, _TAG_BOOL, _TAG_INT_LIST):
+            numbers.extend(values)
+        elif tag in (_TAG_FLOAT, _TAG_FLOAT_LIST):
+            # repr() round-trips floats exactly
+            strings.extend(map(repr, values))
+        else:
+            strings.extend(values)
+
+    if any("\0" in string for string in strings):
+        raise InvalidSaveDataError(f"Cannot save character {character.get('name')}: text contains NUL")
+    width = _number_width(numbers)
+    try:
+        body = b"".join((
+            bytes(fields),
+            struct.pack(f"<{len(counts)}H", *counts),
+            struct.pack(f"<{len(numbers)}{width}", *numbers),
+            "\0".join(strings).encode("utf-8"),
+        ))
+        header = _SAVE_HEADER.pack(SAVE_MAGIC, SAVE_VERSION, _NUMBER_WIDTHS.index(width),
+                                   len(fields), len(numbers), zlib.crc32(body))
+        return header + body
+    except struct.error as e:
+        raise InvalidSaveDataError(f"Cannot save character {character.get('name')}: {e}")
+
+def _number_width(numbers):
+    """Return the narrowest struct code in _NUMBER_WIDTHS that holds every number"""
+    if not numbers:
+        return _NUMBER_WIDTHS[0]
+    low, high = min(numbers), max(numbers)
+    for code in _NUMBER_WIDTHS[:-1]:
+        limit = 1 << (8 * struct.calcsize(code) - 1)
+        if -limit <= low and high < limit:
+            return code
+    # Too large even for i64 is reported by struct.pack
+    return _NUMBER_WIDTHS[-1]
+
+def decode_binary_save(data, character_name="character"):
+    """
+    Decode a binary save; every field carries its type tag
+    
+    Returns: Character dictionary
+    Raises:
+        SaveFileCorruptedError if the data is truncated or malformed
+        InvalidSaveDataError if the save version is not supported
+    """
+    if len(data) < len(SAVE_MAGIC) + 1:
+        raise SaveFileCorruptedError(f"Save file for {character_name} is corrupted: too short")
+    if data[:len(SAVE_MAGIC)] != SAVE_MAGIC:
+        raise SaveFileCorruptedError(f"Save file for {character_name} is not a binary save")
+    version = data[len(SAVE_MAGIC)]
+    if version == SAVE_VERSION:
+        return _decode_binary_save_v2(data, character_name)
+    if version == 1:
+        return _decode_binary_save_v1(data, character_name)
+    raise InvalidSaveDataError(
+        f"Save file for {character_name} has unsupported version {version}")
+
+def _unpack_save_header(header, data, character_name):
+    """Unpack a save header and check the CRC32 of the body after it"""
+    try:
+        fields = header.unpack_from(data, 0)
+    except struct.error as e:
+        raise SaveFileCorruptedError(f"Save file for {character_name} is corrupted: {e}")
+    if zlib.crc32(memoryview(data)[header.size:]) != fields[-1]:
+        raise SaveFileCorruptedError(f"Save file for {character_name} failed its checksum")
+    return fields
+
+def _decode_binary_save_v2(data, character_name):
+    """Decode the current binary format (see the layout at the top of the file)"""
+    _, _, width_index, field_count, number_count, _ = _unpack_save_header(
+        _SAVE_HEADER, data, character_name)
+    try:
+        offset = _SAVE_HEADER.size
+        fields = data[offset:offset + field_count]
+        offset += field_count
+        list_count = len(fields.translate(None, _NON_LIST_BYTES))
+        counts = struct.unpack_from(f"<{list_count}H", data, offset)
+        offset += 2 * list_count
+        width = _NUMBER_WIDTHS[width_index]
+        numbers = struct.unpack_from(f"<{number_count}{width}", data, offset)
+        offset += struct.calcsize(width) * number_count
+        strings = data[offset:].decode("utf-8").split("\0")
+
+        character = {}
+        number_index = 0
+        string_index = 0
+        count_index = 0
+        for field in fields:
+            key, tag = _FIELD_BYTES[field]
+            if key is None:
+                if field >> 3 != _EXTRA_FIELD:
+                    raise ValueError(f"unknown field {field >> 3}")
+                key = strings[string_index]
+                string_index += 1
+            # Most common tags first: stats, then lists and names
+            if tag == _TAG_INT:
+                value = numbers[number_index]
+                number_index += 1
+            elif tag == _TAG_STR_LIST:
+                count = counts[count_index]
+                count_index += 1
+                value = strings[string_index:string_index + count]
+                string_index += count
+            elif tag == _TAG_STR:
+                value = strings[string_index]
+                string_index += 1
+            elif tag == _TAG_INT_LIST:
+                count = counts[count_index]
+                count_index += 1
+                value = list(numbers[number_index:number_index + count])
+                number_index += count
+            elif tag == _TAG_NONE:
+                value = None
+            elif tag == _TAG_BOOL:
+                value = bool(numbers[number_index])
+                number_index += 1
+            elif tag == _TAG_FLOAT:
+                value = float(strings[string_index])
+                string_index += 1
+            else:
+                count = counts[count_index]
+                count_index += 1
+                value = [float(s) for s in strings[string_index:string_index + count]]
+                string_index += count
+            character[key] = value
+    except (struct.error, ValueError, IndexError) as e:
+        raise SaveFileCorruptedError(f"Save file for {character_name} is corrupted: {e}")
+
+    # Every section must be used up exactly, or the save was damaged. A save
+    # with no text at all still splits into one empty string.
+    strings_used = string_index == len(strings) or (string_index == 0 and strings == [""])
+    if len(fields) != field_count or number_index != number_count or not strings_used:
+        raise SaveFileCorruptedError(f"Save file for {character_name} is corrupted")
+    return character
+
+def _decode_binary_save_v1(data, character_name):
+    """Decode a version 1 save, which stored every key name and i64 numbers"""
+    _, _, field_count, number_count, _ = _unpack_save_header(
+        _SAVE_HEADER_V1, data, character_name)
+    try:
+        offset = _SAVE_HEADER_V1.size
+        tags = data[offset:offset + field_count]
+        offset += field_count
+        counts = struct.unpack_from(f"<{field_count}I", data, offset)
+        offset += 4 * field_count
+        numbers = struct.unpack_from(f"<{number_count}q", data, offset)
+        offset += 8 * number_count
+        strings = data[offset:].decode("utf-8").split("\0")
+
+        character = {}
+        number_index = 0
+        string_index = field_count
+        for key, tag, count in zip(strings, tags, counts):
+            if tag == _TAG_STR:
+                value = strings[string_index]
+                string_index += 1
+            elif tag == _TAG_INT:
+                value = numbers[number_index]
+                number_index += 1
+            elif tag == _TAG_STR_LIST:
+                value = strings[string_index:string_index + count]
+                string_index += count
+            elif tag == _TAG_INT_LIST:
+                value = list(numbers[number_index:number_index + count])
+                number_index += count
+            elif tag == _TAG_NONE:
+                value = None
+            elif tag == _TAG_BOOL:
+                value = bool(numbers[number_index])
+                number_index += 1
+            elif tag == _TAG_FLOAT:
+                value = float(strings[string_index])
+                string_index += 1
+            elif tag == _TAG_FLOAT_LIST:
+                value = [float(s) for s in strings[string_index:string_index + count]]
+                string_index += count
+            else:
+                raise ValueError(f"unknown type tag {tag}")
+            character[key] = value
+    except (struct.error, ValueError) as e:
+        raise SaveFileCorruptedError(f"Save file for {character_name} is corrupted: {e}")
+
+    if (len(tags) != field_count or number_index != number_count
+            or string_index != len(strings)):
+        raise SaveFileCorruptedError(f"Save file for {character_name} is corrupted")
+    return character
+
+def list_saved_characters(save_directory="data/save_games", offset=0, limit=None,
+                          sort_by="name"):
 
     """
     Get list of all saved character names
     
-    Returns: List of character names (without _save.txt extension)
+    Reads only the save manifest, never the save files themselves.
+    
+    Args:
+        save_directory: Directory for save files, or a SQLite database path
+        offset: Number of characters to skip (for paging)
+        limit: Maximum number of names to return (None for all)
+        sort_by: "name", "class", "level" or "saved_at"; prefix "-" for descending
+    
+    Returns: List of character names (without _save.bin/_save.txt extension)
     """
     # TODO: Implement this function
     # AI Use. Google Gemini was used to extract character names from file
+    return [summary['name'] for summary in
+            get_save_summaries(save_directory, offset, limit, sort_by)]
 
+def get_save_summaries(save_directory="data/save_games", offset=0, limit=None,
+                       sort_by="name"):
+    """
+    Get a page of save summaries for a load-game screen
     
+    Same arguments as list_saved_characters.
+    
+    Returns: List of {'name', 'class', 'level', 'saved_at'} dictionaries
+    Raises: ValueError if sort_by is not a summary field
+    """
+    field, descending = _parse_sort(sort_by)
+    if is_sqlite_store(save_directory):
+        return get_character_store(save_directory).summaries(offset, limit, field, descending)
+
     if not os.path.exists(save_directory):
         # Return empty list if directory doesn't exist
         return []
-    # Extract character names from filenames
-    files = os.listdir(save_directory)
-    return [f.replace("_save.txt", "") for f in files if f.endswith("_save.txt")]
-    
+    manifest = _get_manifest(save_directory)
+    with manifest.lock:
+        manifest.refresh()
+        names = manifest.sorted_names(field, descending)
+        page = names[offset:] if limit is None else names[offset:offset + limit]
+        return [manifest.summary(name) for name in page]
+
+def _parse_sort(sort_by):
+    """Split a sort_by string into (field, descending)"""
+    descending = sort_by.startswith("-")
+    field = sort_by.lstrip("-")
+    if field not in MANIFEST_FIELDS:
+        raise ValueError(f"Cannot sort saves by: {sort_by}")
+    return field, descending
 
 def delete_character(character_name, save_directory="data/save_games"):
 
 
     
     # TODO: Implement character deletion
+    if is_sqlite_store(save_directory):
+        return get_character_store(save_directory).delete(character_name)
+
     # Verify file exists before attempting deletion
-    filename = f"{character_name}_save.txt"
-    filepath = os.path.join(save_directory, filename)
-    if not os.path.exists(filepath):
+    filepaths = [_save_path(character_name, save_directory, save_format)
+                 for save_format in SAVE_SUFFIXES]
+    existing = [filepath for filepath in filepaths if os.path.exists(filepath)]
+    if not existing:
         raise CharacterNotFoundError(f"Character {character_name} was not found.")
-    os.remove(filepath)
+    for filepath in existing:
+        _remove_save_file(filepath)
+    _discard_journal(character_name, save_directory)
+    _invalidate_load_cache(character_name, save_directory)
+    _get_manifest(save_directory).record_delete(character_name)
 
     return True
 
 
+def find_saved_characters(save_directory="data/save_games", character_class=None,
+                          min_level=None, max_level=None):
+    """
+    Find saved characters by class and level range
+    
+    A SQLite store answers this from its indexes; a save directory scans
+    its manifest.
+    
+    Returns: List of character names, sorted
+    """
+    if is_sqlite_store(save_directory):
+        return get_character_store(save_directory).find(character_class, min_level, max_level)
+
+    matches = []
+    for summary in get_save_summaries(save_directory):
+        if character_class is not None and summary['class'] != character_class:
+            continue
+        if min_level is not None and summary['level'] < min_level:
+            continue
+        if max_level is not None and summary['level'] > max_level:
+            continue
+        matches.append(summary['name'])
+    return matches
+
+def save_transaction(save_directory="data/save_games"):
+    """
+    Group saves and deletes into one transaction
+    
+    Use as "with save_transaction(path): ...". For a SQLite store every
+    write inside the block is committed together (or rolled back on an
+    exception), which is much faster than one commit per save. Directory
+    saves are already atomic per file, so this is a no-op for them.
+    """
+    if is_sqlite_store(save_directory):
+        return get_character_store(save_directory).transaction()
+    return nullcontext()
+
+def load_characters(names, save_directory="data/save_games", max_workers=BULK_IO_WORKERS):
+    """
+    Load many characters, overlapping file I/O on a bounded thread pool
+    
+    One bad save does not stop the batch: its entry holds the exception
+    (CharacterNotFoundError, SaveFileCorruptedError, InvalidSaveDataError)
+    instead of a character.
+    
+    Returns: Dictionary of name -> character dictionary or exception, in input order
+    """
+    names = list(names)
+    return _run_bulk(lambda name: load_character(name, save_directory),
+                     names, names, save_directory, max_workers)
+
+def save_characters(characters, save_directory="data/save_games", max_workers=BULK_IO_WORKERS):
+    """
+    Save many characters, overlapping file I/O on a bounded thread pool
+    
+    A SQLite store saves the whole batch in one transaction instead, since
+    it has a single connection.
+    
+    Returns: Dictionary of name -> True or the exception that save raised
+    """
+    characters = list(characters)
+    names = [character['name'] for character in characters]
+    with save_transaction(save_directory):
+        return _run_bulk(lambda character: save_character(character, save_directory),
+                         characters, names, save_directory, max_workers)
+
+def _run_bulk(operation, items, names, save_directory, max_workers):
+    """Apply operation to each item, keeping any exception as that item's result"""
+    def attempt(item):
+        try:
+            return operation(item)
+        except Exception as e:
+            # One failure must not discard the rest of the batch
+            return e
+
+    # A SQLite store has one connection, so threads would only queue on its lock
+    if max_workers == 1 or len(items) <= 1 or is_sqlite_store(save_directory):
+        return dict(zip(names, map(attempt, items)))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return dict(zip(names, pool.map(attempt, items)))
+
+# ============================================================================
+# SAVE JOURNAL
+# ============================================================================
+
+_journals = {}
+_journals_lock = threading.Lock()
+
+class _JournalState:
+    """What an incremental save needs to know about a character's files"""
+    __slots__ = ('snapshot_crc', 'snapshot_key', 'journal_size', 'records', 'baseline')
+
+    def __init__(self, snapshot_crc, snapshot_key, baseline):
+        self.snapshot_crc = snapshot_crc
+        self.snapshot_key = snapshot_key
+        self.journal_size = 0
+        self.records = 0
+        self.baseline = baseline
+
+def save_character_incremental(character, save_directory="data/save_games", fsync=False):
+    """
+    Save only what changed since the last save of this character
+    
+    The first save in a session, and every JOURNAL_COMPACT_RECORDS-th one,
+    writes a full snapshot with save_character. The rest append one small
+    delta record to the character's journal, which load_character replays.
+    A SQLite store just updates the row.
+    
+    Returns: True if saved successfully
+    Raises: SaveFileWriteError if the save could not be written
+    """
+    if is_sqlite_store(save_directory):
+        return save_character(character, save_directory, fsync)
+
+    name = character['name']
+    key = (os.path.abspath(save_directory), name)
+    snapshot_path = _save_path(name, save_directory, "binary")
+    journal_path = _journal_path(name, save_directory)
+    with _journals_lock:
+        state = _journals.get(key)
+
+    if (state is None or state.records >= JOURNAL_COMPACT_RECORDS
+            or not _journal_state_current(state, snapshot_path, journal_path)):
+        # Compact: a new snapshot replaces the journal
+        data = _write_snapshot(character, save_directory, fsync)
+        state = _JournalState(zlib.crc32(data), _stat_key(snapshot_path),
+                              _copy_character(character))
+        with _journals_lock:
+            _journals[key] = state
+        return True
+
+    delta = _character_delta(state.baseline, character)
+    if not delta:
+        return True
+    _manifest_save_line(character)
+    payload = encode_binary_save(delta)
+    record = _JOURNAL_RECORD.pack(len(payload)) + payload
+    if state.journal_size == 0:
+        record = _JOURNAL_HEADER.pack(JOURNAL_MAGIC, state.snapshot_crc) + record
+    try:
+        with open(journal_path, "ab") as f:
+            f.write(record)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+    except OSError as e:
+        with _journals_lock:
+            _journals.pop(key, None)
+        raise SaveFileWriteError(f"Could not write save journal {journal_path}: {e}")
+
+    state.journal_size += len(record)
+    state.records += 1
+    state.baseline = _copy_character(character)
+    _invalidate_load_cache(name, save_directory)
+    _get_manifest(save_directory).record_save(character)
+    return True
+
+def _journal_path(character_name, save_directory):
+    """Return the journal file path for a character"""
+    return os.path.join(save_directory, f"{character_name}{JOURNAL_SUFFIX}")
+
+def _stat_key(path):
+    """Return (inode, size, mtime_ns) for a file, or None if it is missing"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+def _journal_state_current(state, snapshot_path, journal_path):
+    """Check that no other writer has touched the snapshot or journal"""
+    journal_key = _stat_key(journal_path)
+    journal_size = journal_key[1] if journal_key else 0
+    return (_stat_key(snapshot_path) == state.snapshot_key
+            and journal_size == state.journal_size)
+
+def _discard_journal(character_name, save_directory):
+    """Remove a character's journal after a full snapshot or delete"""
+    with _journals_lock:
+        _journals.pop((os.path.abspath(save_directory), character_name), None)
+    _remove_save_file(_journal_path(character_name, save_directory))
+
+def _replay_journal(character, character_name, snapshot_data, save_directory):
+    """
+    Apply a character's journal on top of its snapshot
+    
+    Replay stops at the first incomplete or damaged record, which is what a
+    crash during an append leaves behind.
+    """
+    journal_path = _journal_path(character_name, save_directory)
+    try:
+        with open(journal_path, "rb") as f:
+            journal = f.read()
+    except FileNotFoundError:
+        return character
+    except OSError as e:
+        raise SaveFileCorruptedError(f"Could not read save journal {journal_path}: {e}")
+
+    if len(journal) < _JOURNAL_HEADER.size:
+        return character
+    magic, snapshot_crc = _JOURNAL_HEADER.unpack_from(journal, 0)
+    if magic != JOURNAL_MAGIC or snapshot_crc != zlib.crc32(snapshot_data):
+        # Written against an older snapshot; its changes are already included
+        return character
+
+    offset = _JOURNAL_HEADER.size
+    while offset + _JOURNAL_RECORD.size <= len(journal):
+        (length,) = _JOURNAL_RECORD.unpack_from(journal, offset)
+        start = offset + _JOURNAL_RECORD.size
+        if start + length > len(journal):
+            break
+        try:
+            delta = decode_binary_save(journal[start:start + length], character_name)
+        except (SaveFileCorruptedError, InvalidSaveDataError):
+            break
+        _apply_delta(character, delta)
+        offset = start + length
+    return character
+
+def _character_delta(old, new):
+    """Build the delta that turns old into new"""
+    delta = {}
+    for key, value in new.items():
+        if key in old and old[key] == value:
+            continue
+        previous = old.get(key)
+        if isinstance(value, list) and isinstance(previous, list):
+            try:
+                removed = list((Counter(previous) - Counter(value)).elements())
+                added = list((Counter(value) - Counter(previous)).elements())
+            except TypeError:
+                removed = added = None
+            # Fall back to a full set if add/remove wouldn't keep the order
+            if removed is not None and _apply_list_delta(list(previous), removed, added) == value:
+                if removed:
+                    delta["-" + key] = removed
+                if added:
+                    delta["+" + key] = added
+                continue
+        delta["=" + key] = value
+    for key in old:
+        if key not in new:
+            delta["!" + key] = None
+    return delta
+
+def _apply_delta(character, delta):
+    """Apply one journal delta to a character in place"""
+    for op_key, value in delta.items():
+        op, key = op_key[0], op_key[1:]
+        if op == "=":
+            character[key] = value
+        elif op == "-":
+            _apply_list_delta(character.setdefault(key, []), value, ())
+        elif op == "+":
+            character.setdefault(key, []).extend(value)
+        elif op == "!":
+            character.pop(key, None)
+
+def _apply_list_delta(items, removed, added):
+    """Remove one occurrence of each removed item, then append added ones"""
+    for item in removed:
+        if item in items:
+            items.remove(item)
+    items.extend(added)
+    return items
+
+def _copy_character(character):
+    """Copy a character deeply enough that later list edits don't leak in"""
+    copy = {key: list(value) if isinstance(value, list) else value
+            for key, value in character.items()}
+    return Character.from_dict(copy) if isinstance(character, Character) else copy
+
+# ============================================================================
+# AUTOSAVE
+# ============================================================================
+
+class AutosaveCache:
+    """
+    Write-behind cache that saves characters off the game thread
+    
+    mark_dirty() only copies the character into the pending set, so a menu
+    action never waits on the disk; repeated changes to one character are
+    coalesced into a single save. A background thread started by start()
+    flushes every interval seconds, or early once max_dirty characters are
+    waiting. Call flush() where a save must happen now (quit, death) and
+    close() when done.
+    """
+
+    def __init__(self, save_directory="data/save_games", interval=AUTOSAVE_INTERVAL,
+                 max_dirty=AUTOSAVE_MAX_DIRTY, save=None):
+        self.save_directory = save_directory
+        self.interval = interval
+        self.max_dirty = max_dirty
+        self.save = save or save_character_incremental
+        self.errors = {}            # name -> exception from the last failed save
+        self.saves = 0
+        self._dirty = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread = None
+
+    def mark_dirty(self, character):
+        """Queue a copy of character to be saved; returns immediately"""
+        snapshot = _copy_character(character)
+        with self._lock:
+            self._dirty[snapshot['name']] = snapshot
+            full = len(self._dirty) >= self.max_dirty
+        if full:
+            self._wake.set()
+
+    def pending(self):
+        """Return the names waiting to be saved"""
+        with self._lock:
+            return list(self._dirty)
+
+    def flush(self):
+        """
+        Save every pending character now
+        
+        Returns: Dictionary of name -> True or the exception its save raised
+        Failed characters stay pending unless a newer copy was queued.
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._dirty = self._dirty, {}
+            results = {}
+            for name, character in batch.items():
+                try:
+                    results[name] = self.save(character, self.save_directory)
+                    self.saves += 1
+                    self.errors.pop(name, None)
+                except Exception as e:
+                    # Any failure (including a raw OSError) must not drop the
+                    # rest of the batch
+                    results[name] = self.errors[name] = e
+                    with self._lock:
+                        self._dirty.setdefault(name, character)
+            return results
+
+    def start(self):
+        """Start the background flush thread"""
+        if self._thread is None:
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stopping:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                # Keep autosaving; close() flushes again and reports errors
+                pass
+
+    def close(self):
+        """Stop the background thread and flush what is left"""
+        if self._thread is not None:
+            self._stopping = True
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+        return self.flush()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+# ============================================================================
+# LOAD CACHE
+# ============================================================================
+
+_load_cache = None
+
+def enable_load_cache(max_entries=LOAD_CACHE_SIZE):
+    """
+    Put a bounded LRU cache in front of load_character for save directories
+    
+    Entries are checked against the save and journal files' inode, size and
+    mtime on every hit, and dropped by save_character/delete_character, so
+    edits by other processes are picked up too. SQLite stores are not cached.
+    
+    Returns: The new CharacterLoadCache
+    """
+    global _load_cache
+    _load_cache = CharacterLoadCache(max_entries)
+    return _load_cache
+
+def disable_load_cache():
+    """Turn the load cache off and drop its entries"""
+    global _load_cache
+    _load_cache = None
+
+def load_cache_stats():
+    """Return the load cache's hit/miss counters, or None if it is off"""
+    cache = _load_cache
+    return cache.stats() if cache is not None else None
+
+def _invalidate_load_cache(character_name, save_directory):
+    cache = _load_cache
+    if cache is not None:
+        cache.invalidate((os.path.abspath(save_directory), character_name))
+
+class CharacterLoadCache:
+    """
+    LRU map of (save directory, name) -> loaded character
+    
+    Characters are copied on the way in and on every hit, so a caller
+    editing its dictionary can never change the cached one.
+    """
+
+    def __init__(self, max_entries=LOAD_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()   # key -> (validity, character)
+        self._lock = threading.Lock()
+
+    def get(self, key, validity):
+        """Return a copy of the cached character, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != validity:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return _copy_character(entry[1])
+
+    def put(self, key, validity, character):
+        """Store a copy of character, evicting the least recently used"""
+        with self._lock:
+            self._entries[key] = (validity, _copy_character(character))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        """Drop one entry"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Drop every entry and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self):
+        """Return {'hits', 'misses', 'size', 'max_entries'}"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'size': len(self._entries), 'max_entries': self.max_entries}
+
+# ============================================================================
+# SAVE MANIFEST
+# ============================================================================
+
+_manifests = {}
+_manifests_lock = threading.Lock()
+
+def _get_manifest(save_directory):
+    """Return the shared SaveManifest for a save directory"""
+    key = os.path.abspath(save_directory)
+    with _manifests_lock:
+        manifest = _manifests.get(key)
+        if manifest is None:
+            manifest = _manifests[key] = SaveManifest(save_directory)
+        return manifest
+
+def rebuild_save_manifest(save_directory="data/save_games"):
+    """
+    Rebuild a directory's manifest from its save files
+    
+    Needed only if saves were copied in or removed by hand; a directory
+    that has saves but no manifest is rebuilt automatically.
+    
+    Returns: Number of saves in the new manifest
+    """
+    manifest = _get_manifest(save_directory)
+    with manifest.lock:
+        return manifest.rebuild()
+
+class SaveManifest:
+    """
+    In-memory view of a save directory's manifest file
+    
+    The file is only appended to, so refresh() reads just the lines added
+    since the last call. Sorted name lists are cached per sort order until
+    the entries change.
+    """
+
+    def __init__(self, save_directory):
+        self.save_directory = save_directory
+        self.path = os.path.join(save_directory, MANIFEST_FILENAME)
+        self.lock = threading.RLock()
+        self._reset()
+
+    def _reset(self):
+        self.entries = {}       # name -> (class, level, saved_at)
+        self.line_count = 0
+        self.offset = 0
+        self.file_id = None
+        self._sorted = {}
+
+    def refresh(self):
+        """
+        Read any lines appended since the last refresh
+        
+        Raises: SaveFileWriteError if the manifest can't be read or rebuilt
+        """
+        try:
+            self._read_new_lines()
+        except OSError as e:
+            raise SaveFileWriteError(f"Could not read save manifest {self.path}: {e}")
+
+    def _read_new_lines(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self._reset()
+            if any(f.endswith(tuple(SAVE_SUFFIXES.values()))
+                   for f in os.listdir(self.save_directory)):
+                self.rebuild()
+            return
+        file_id = (stat.st_dev, stat.st_ino)
+        if file_id != self.file_id or stat.st_size < self.offset:
+            # Replaced by a compaction or rebuild; read it from the start
+            self._reset()
+            self.file_id = file_id
+        if stat.st_size > self.offset:
+            with open(self.path, "rb") as f:
+                f.seek(self.offset)
+                chunk = f.read()
+            # Leave a partly written last line for the next refresh
+            end = chunk.rfind(b"\n") + 1
+            self._apply(chunk[:end].decode("utf-8"))
+            self.offset += end
+
+    def _apply(self, text):
+        """Apply manifest lines to the entries"""
+        for line in text.splitlines():
+            fields = line.split("\t")
+            self.line_count += 1
+            try:
+                if fields[0] == "S":
+                    self.entries[fields[1]] = (fields[2], int(fields[3]), float(fields[4]))
+                elif fields[0] == "D":
+                    self.entries.pop(fields[1], None)
+            except (IndexError, ValueError):
+                continue    # Skip damaged lines
+        self._sorted.clear()
+
+    def record_save(self, character):
+        """Append a save line for a character"""
+        self._append(_manifest_save_line(character))
+
+    def record_delete(self, character_name):
+        """Append a delete line for a character"""
+        self._append(_manifest_line("D", character_name))
+
+    def _append(self, line):
+        with self.lock:
+            self.refresh()
+            try:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line)
+            except OSError as e:
+                raise SaveFileWriteError(f"Could not update save manifest {self.path}: {e}")
+            self.refresh()
+            if self.line_count > 2 * len(self.entries) + MANIFEST_COMPACT_SLACK:
+                self._write(self.entries)
+
+    def rebuild(self):
+        """
+        Scan the save files and rewrite the manifest from them
+        
+        Raises: SaveFileWriteError if the directory can't be scanned or written
+        """
+        try:
+            entries = self._scan_saves()
+        except OSError as e:
+            raise SaveFileWriteError(f"Could not rebuild save manifest {self.path}: {e}")
+        self._write(entries)
+        return len(entries)
+
+    def _scan_saves(self):
+        """Return manifest entries for every readable save file"""
+        entries = {}
+        for f in os.listdir(self.save_directory):
+            for suffix in SAVE_SUFFIXES.values():
+                if not f.endswith(suffix):
+                    continue
+                name = f[:-len(suffix)]
+                try:
+                    character = load_character(name, self.save_directory)
+                except (SaveFileCorruptedError, InvalidSaveDataError):
+                    continue
+                saved_at = os.path.getmtime(os.path.join(self.save_directory, f))
+                entries[name] = (character.get('class', ""),
+                                 int(character.get('level', 0)), saved_at)
+        return entries
+
+    def _write(self, entries):
+        """Replace the manifest file with one line per entry"""
+        text = "".join(_manifest_line("S", name, *entry) for name, entry in entries.items())
+        _atomic_write(self.path, text.encode("utf-8"))
+        self._reset()
+        self.refresh()
+
+    def sorted_names(self, field, descending=False):
+        """Return every name ordered by one summary field, cached"""
+        key = (field, descending)
+        names = self._sorted.get(key)
+        if names is None:
+            if field == "name":
+                names = sorted(self.entries, reverse=descending)
+            else:
+                column = MANIFEST_FIELDS.index(field) - 1
+                names = sorted(self.entries, reverse=descending,
+                               key=lambda name: (self.entries[name][column], name))
+            self._sorted[key] = names
+        return names
+
+    def summary(self, name):
+        """Return one summary dictionary"""
+        char_class, level, saved_at = self.entries[name]
+        return {'name': name, 'class': char_class, 'level': level, 'saved_at': saved_at}
+
+def _manifest_save_line(character):
+    """Format the manifest line recording a character's save"""
+    return _manifest_line("S", character['name'], character.get('class', ""),
+                          int(character.get('level', 0)), time.time())
+
+def _manifest_line(kind, name, *fields):
+    """Format one manifest line; tabs and newlines would break the format"""
+    values = (kind, name) + tuple(str(field) for field in fields)
+    if any(c in value for value in values for c in "\t\r\n"):
+        raise InvalidSaveDataError(f"Cannot save {name!r}: names can't contain tabs or newlines")
+    return "\t".join(values) + "\n"
+
+# ============================================================================
+# SQLITE CHARACTER STORE
+# ============================================================================
+
+_character_stores = {}
+_character_stores_lock = threading.Lock()
+
+def is_sqlite_store(save_directory):
+    """Return True if save_directory names a SQLite database"""
+    return str(save_directory).endswith(SQLITE_SUFFIXES)
+
+def get_character_store(path):
+    """Return the shared SQLiteCharacterStore for a database path"""
+    key = os.path.abspath(path)
+    with _character_stores_lock:
+        store = _character_stores.get(key)
+        if store is None:
+            store = _character_stores[key] = SQLiteCharacterStore(path)
+        return store
+
+def close_character_stores():
+    """Close every open SQLite store (e.g. on quit or between tests)"""
+    with _character_stores_lock:
+        for store in _character_stores.values():
+            store.close()
+        _character_stores.clear()
+
+class SQLiteCharacterStore:
+    """
+    All characters in one SQLite database in WAL mode
+    
+    Each row keeps the indexed name, class and level columns next to the
+    binary save blob, so listing and filtering never decode a save. One
+    connection is shared between threads behind a lock.
+    """
+
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        try:
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Autocommit mode; transaction() issues BEGIN/COMMIT itself
+            self.connection = sqlite3.connect(path, isolation_level=None,
+                                              check_same_thread=False)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.executescript("""
+                CREATE TABLE IF NOT EXISTS characters (
+                    name TEXT PRIMARY KEY,
+                    class TEXT NOT NULL,
+                    level INTEGER NOT NULL,
+                    saved_at REAL NOT NULL,
+                    data BLOB NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS characters_class ON characters (class, level);
+                CREATE INDEX IF NOT EXISTS characters_level ON characters (level);
+            """)
+        except (OSError, sqlite3.Error) as e:
+            raise SaveFileWriteError(f"Could not open save database {path}: {e}")
+        self.path = path
+        self.lock = threading.RLock()
+        self._depth = 0
+
+    @contextmanager
+    def transaction(self):
+        """Run the block in one transaction; nested blocks join the outer one"""
+        with self.lock:
+            if self._depth == 0:
+                self.connection.execute("BEGIN IMMEDIATE")
+            self._depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    self.connection.execute("ROLLBACK")
+                raise
+            self._depth -= 1
+            if self._depth == 0:
+                try:
+                    self.connection.execute("COMMIT")
+                except sqlite3.Error as e:
+                    self.connection.execute("ROLLBACK")
+                    raise SaveFileWriteError(f"Could not commit saves to {self.path}: {e}")
+
+    def save(self, character):
+        """Insert or replace one character; returns True"""
+        data = encode_binary_save(character)
+        try:
+            with self.lock:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO characters (name, class, level, saved_at, data) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (character['name'], character.get('class', ""),
+                     character.get('level', 0), time.time(), data))
+        except sqlite3.Error as e:
+            raise SaveFileWriteError(f"Could not save {character['name']} to {self.path}: {e}")
+        return True
+
+    def load(self, character_name):
+        """Return one character dictionary"""
+        try:
+            with self.lock:
+                row = self.connection.execute(
+                    "SELECT data FROM characters WHERE name = ?", (character_name,)).fetchone()
+        except sqlite3.Error as e:
+            raise SaveFileCorruptedError(f"Could not read {character_name} from {self.path}: {e}")
+        if row is None:
+            raise CharacterNotFoundError(f"Save file not found for: {character_name}")
+        return Character.from_dict(decode_binary_save(row[0], character_name))
+
+    def summaries(self, offset=0, limit=None, field="name", descending=False):
+        """Return one page of summary dictionaries, sorted by an indexed column"""
+        if field not in MANIFEST_FIELDS:
+            raise ValueError(f"Cannot sort saves by: {field}")
+        order = "DESC" if descending else "ASC"
+        with self.lock:
+            rows = self.connection.execute(
+                f"SELECT name, class, level, saved_at FROM characters "
+                f"ORDER BY {field} {order}, name {order} LIMIT ? OFFSET ?",
+                (-1 if limit is None else limit, offset))
+            return [dict(zip(MANIFEST_FIELDS, row)) for row in rows]
+
+    def find(self, character_class=None, min_level=None, max_level=None):
+        """Return names matching a class and level range, using the indexes"""
+        clauses = []
+        params = []
+        if character_class is not None:
+            clauses.append("class = ?")
+            params.append(character_class)
+        if min_level is not None:
+            clauses.append("level >= ?")
+            params.append(min_level)
+        if max_level is not None:
+            clauses.append("level <= ?")
+            params.append(max_level)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self.lock:
+            rows = self.connection.execute(
+                f"SELECT name FROM characters{where} ORDER BY name", params)
+            return [name for (name,) in rows]
+
+    def delete(self, character_name):
+        """Delete one character; returns True"""
+        try:
+            with self.lock:
+                cursor = self.connection.execute(
+                    "DELETE FROM characters WHERE name = ?", (character_name,))
+        except sqlite3.Error as e:
+            raise SaveFileWriteError(f"Could not delete {character_name} from {self.path}: {e}")
+        if cursor.rowcount == 0:
+            raise CharacterNotFoundError(f"Character {character_name} was not found.")
+        return True
+
+    def close(self):
+        """Close the database connection"""
+        with self.lock:
+            self.connection.close()
+
 # ============================================================================
 # CHARACTER OPERATIONS
 # ============================================================================
@@ -0,0 +1,137 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Content Generator Module
+
+Writes synthetic quest and item files in the same QUEST_ID:/ITEM_ID: block
+format as data/quests.txt and data/items.txt, for scale testing.
+
+- Quests form a random prerequisite forest (each quest has at most one
+  prerequisite) with a controllable maximum depth and fan-out.
+- Items get a weighted mix of types, matching effects and costs that grow
+  with the effect value.
+- Output is fully determined by the seed.
+
+Usage: python content_generator.py QUEST_FILE ITEM_FILE QUESTS ITEMS [SEED]
+"""
+
+import math
+import random
+import sys
+
+# Item type weights and the stats each type can affect
+ITEM_TYPE_WEIGHTS = (('weapon', 30), ('armor', 25), ('consumable', 45))
+ITEM_EFFECT_STATS = {
+    'weapon': ('strength', 'magic'),
+    'armor': ('max_health',),
+    'consumable': ('health', 'magic', 'strength')
+}
+
+QUEST_VERBS = ("Defend", "Explore", "Recover", "Escort", "Cleanse", "Hunt")
+QUEST_PLACES = ("the Village", "the Old Mine", "the Marsh", "the Keep", "the Pass", "the Ruins")
+ITEM_ADJECTIVES = ("Rusty", "Iron", "Steel", "Blessed", "Ancient", "Runed")
+
+def generate_content_pack(quest_file, item_file, quest_count, item_count, seed=0,
+                          max_depth=5, fan_out=3, root_chance=0.2):
+    """
+    Write a quest file and an item file of the requested sizes
+    
+    Args:
+        quest_file: Path of the quest file to write
+        item_file: Path of the item file to write
+        quest_count: Number of quests (N)
+        item_count: Number of items (M)
+        seed: Random seed; the same seed always gives the same files
+        max_depth: Longest prerequisite chain (1 = every quest is a root)
+        fan_out: Most quests that can share one prerequisite
+        root_chance: Chance a quest starts a new chain when it could
+                     extend an existing one
+    
+    Returns: Tuple of (quests written, items written)
+    """
+    rng = random.Random(seed)
+    write_quests(quest_file, quest_count, rng, max_depth, fan_out, root_chance)
+    write_items(item_file, item_count, rng)
+    return quest_count, item_count
+
+def write_quests(filename, count, rng, max_depth=5, fan_out=3, root_chance=0.2):
+    """
+    Write count quests whose prerequisites form a valid forest
+    
+    Prerequisites always point at an earlier quest, so there are no cycles
+    and every chain is at most max_depth long. Required level never goes
+    down along a chain.
+    """
+    # Quests that can still take another child: parallel lists, swap-removed
+    open_ids = []
+    open_depths = []
+    open_levels = []
+    open_children = []
+
+    with open(filename, 'w', encoding='utf-8') as f:
+        for index in range(count):
+            quest_id = f"quest_{index}"
+            if open_ids and rng.random() >= root_chance:
+                slot = rng.randrange(len(open_ids))
+                prerequisite = open_ids[slot]
+                depth = open_depths[slot] + 1
+                level = open_levels[slot] + rng.randint(0, 2)
+                open_children[slot] += 1
+                if open_children[slot] >= fan_out:
+                    _swap_remove(slot, open_ids, open_depths, open_levels, open_children)
+            else:
+                prerequisite = "NONE"
+                depth = 1
+                level = rng.randint(1, 5)
+
+            if depth < max_depth and fan_out > 0:
+                open_ids.append(quest_id)
+                open_depths.append(depth)
+                open_levels.append(level)
+                open_children.append(0)
+
+            reward_xp = level * 50 + rng.randint(0, 50)
+            reward_gold = level * 20 + rng.randint(0, 30)
+            title = f"{rng.choice(QUEST_VERBS)} {rng.choice(QUEST_PLACES)}"
+            f.write(f"QUEST_ID: {quest_id}\n"
+                    f"TITLE: {title}\n"
+                    f"DESCRIPTION: {title} and report back.\n"
+                    f"REWARD_XP: {reward_xp}\n"
+                    f"REWARD_GOLD: {reward_gold}\n"
+                    f"REQUIRED_LEVEL: {level}\n"
+                    f"PREREQUISITE: {prerequisite}\n\n")
+
+def write_items(filename, count, rng):
+    """Write count items with weighted types, matching effects and costs"""
+    types = [item_type for item_type, weight in ITEM_TYPE_WEIGHTS]
+    weights = [weight for item_type, weight in ITEM_TYPE_WEIGHTS]
+
+    with open(filename, 'w', encoding='utf-8') as f:
+        for index in range(count):
+            item_type = rng.choices(types, weights)[0]
+            stats = ITEM_EFFECT_STATS[item_type]
+            # Effect sizes are skewed: most items are small, a few are strong
+            value = max(1, int(rng.expovariate(1 / 8)))
+            effect = f"{rng.choice(stats)}:{value}"
+            if len(stats) > 1 and rng.random() < 0.1:
+                effect += f",{rng.choice(stats)}:{max(1, value // 2)}"
+            cost = max(1, int(value * 12 * math.exp(rng.gauss(0, 0.3))))
+            name = f"{rng.choice(ITEM_ADJECTIVES)} {item_type.title()} {index}"
+            f.write(f"ITEM_ID: item_{index}\n"
+                    f"NAME: {name}\n"
+                    f"TYPE: {item_type}\n"
+                    f"EFFECT: {effect}\n"
+                    f"COST: {cost}\n"
+                    f"DESCRIPTION: A generated {item_type}.\n\n")
+
+def _swap_remove(slot, *columns):
+    """Remove position slot from parallel lists in O(1)"""
+    for column in columns:
+        column[slot] = column[-1]
+        column.pop()
+
+if __name__ == "__main__":
+    if len(sys.argv) < 5:
+        print(__doc__)
+        sys.exit(1)
+    seed = int(sys.argv[5]) if len(sys.argv) > 5 else 0
+    generate_content_pack(sys.argv[1], sys.argv[2], int(sys.argv[3]), int(sys.argv[4]), seed)
@@ -14,8 +14,18 @@ class GameError(Exception):
     pass
 
 class DataError(GameError):
-    """Base exception for data-related errors"""
-    pass
+    """
+    Base exception for data-related errors
+    
+    source names the file the error came from when that isn't clear from
+    where it was raised (e.g. one shard of a parallel load); it is shown
+    in front of the message.
+    """
+    source = None
+
+    def __str__(self):
+        message = super().__str__()
+        return f"{self.source}: {message}" if self.source else message
 
 class CharacterError(GameError):
     """Base exception for character-related errors"""
@@ -50,6 +60,20 @@ class CorruptedDataError(DataError):
     """Raised when data file is corrupted or unreadable"""
     pass
 
+class DataValidationError(InvalidDataFormatError):
+    """Raised once with every bad record found while validating a whole file"""
+
+    def __init__(self, filename, errors):
+        # errors is a list of (line_number, message) tuples
+        self.filename = filename
+        self.errors = errors
+        lines = "\n".join(f"  line {line}: {message}" for line, message in errors)
+        super().__init__(f"{len(errors)} error(s) in {filename}:\n{lines}")
+
+    def __reduce__(self):
+        # The state dict carries attributes set later, such as source
+        return (type(self), (self.filename, self.errors), self.__dict__)
+
 # Character Exceptions
 class InvalidCharacterClassError(CharacterError):
     """Raised when an invalid character class is specified"""
@@ -123,3 +147,7 @@ class InvalidSaveDataError(GameError):
     """Raised when save file contains invalid data"""
     pass
 
+class SaveFileWriteError(GameError):
+    """Raised when a save file cannot be written"""
+    pass
+
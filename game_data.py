@@ -10,17 +10,49 @@ This module handles loading and validating game data from text files.
 """
 
 import os
+import bisect
+import glob
+import gzip
+import hashlib
+import io
+import lzma
+import mmap
+import pickle
+import struct
+import sys
+import zlib
+from collections.abc import Mapping, MutableMapping
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
 from custom_exceptions import (
     InvalidDataFormatError,
     MissingDataFileError,
-    CorruptedDataError
+    CorruptedDataError,
+    DataValidationError
 )
 
+# Compiled catalog caches are written next to the source file
+CACHE_SUFFIX = ".cache"
+CACHE_VERSION = 2
+
+# Indexed binary catalog layout (see compile_catalog)
+CATALOG_MAGIC = b"QCCATLG\x00"
+CATALOG_VERSION = 1
+_CATALOG_HEADER = struct.Struct("<8sIIQ")    # magic, version, count, index offset
+_CATALOG_ENTRY = struct.Struct("<QIQI")      # key offset/length, record offset/length
+
+# Compressed data files are decoded as a stream with the matching codec
+COMPRESSED_OPENERS = {".gz": gzip.open, ".xz": lzma.open}
+SHARD_PATTERNS = ("*.txt", "*.txt.gz", "*.txt.xz")
+# Errors a codec can raise part-way through a damaged stream
+_DECODE_ERRORS = (UnicodeDecodeError, EOFError, zlib.error, lzma.LZMAError, gzip.BadGzipFile)
+
 # ============================================================================
 # DATA LOADING FUNCTIONS
 # ============================================================================
 
-def load_quests(filename="data/quests.txt"):
+def load_quests(filename="data/quests.txt", use_cache=False, as_records=False,
+                report_all=False, lazy=False):
     """
     Load quest data from file
     
@@ -33,50 +65,32 @@ def load_quests(filename="data/quests.txt"):
     REQUIRED_LEVEL: 1
     PREREQUISITE: previous_quest_id (or NONE)
     
+    If use_cache is True, a compiled cache (filename + ".cache") is used
+    when it still matches the source file, skipping parsing entirely.
+    If as_records is True, values are compact Quest records instead of dicts.
+    If report_all is True, every bad block is reported in one
+    DataValidationError instead of stopping at the first one.
+    If lazy is True, a LazyCatalog is returned that only parses a quest
+    the first time it is accessed (use_cache and report_all are ignored).
+    Compressed files can't seek to a block without decompressing everything
+    before it, so for .gz/.xz files lazy is ignored and they load eagerly.
+    
     Returns: Dictionary of quests {quest_id: quest_data_dict}
     Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
     """
-    # TODO: Implement this function
-    # Must handle:
-    # - FileNotFoundError → raise MissingDataFileError
-    # - Invalid format → raise InvalidDataFormatError
-    # - Corrupted/unreadable data → raise CorruptedDataError
+    if lazy and not _is_compressed(filename):
+        return LazyCatalog(filename, "quests", as_records)
+    if use_cache:
+        quests = _load_with_cache(filename, "quests", load_quests)
+        return _as_records(quests, Quest) if as_records else quests
+    # Built on iter_quests so only one block is held in memory at a time
     quests = {}
-    
-    try:
-        with open(filename, 'r') as f:
-            lines = f.readlines()
-    except FileNotFoundError:
-        raise MissingDataFileError(f"Could not find file: {filename}")
-    except:
-        raise CorruptedDataError(f"File {filename} is corrupted or has wrong encoding.")
-    
-    current_block = []
-    for line in lines:
-        line = line.strip()
-        if line:
-            current_block.append(line)
-        elif current_block:
-            # Blank Line
-            quest_data = parse_quest_block(current_block)
-            validate_quest_data(quest_data)
-            quests[quest_data['quest_id']] = quest_data
-            current_block = []
-    
-    # Process the final block if the file didn't end with a blank line
-    if current_block:
-        quest_data = parse_quest_block(current_block)
-        validate_quest_data(quest_data)
+    for quest_data in iter_quests(filename, as_records, report_all):
         quests[quest_data['quest_id']] = quest_data
-
     return quests
-    
-    
-     
 
-    pass
-
-def load_items(filename="data/items.txt"):
+def load_items(filename="data/items.txt", use_cache=False, as_records=False,
+               report_all=False, lazy=False):
     """
     Load item data from file
     
@@ -88,43 +102,72 @@ def load_items(filename="data/items.txt"):
     COST: 100
     DESCRIPTION: Item description
 
+    Each item also gets an 'effects' field: the EFFECT value pre-parsed
+    into a tuple of (stat_name, value) pairs (see parse_effect_string).
+
+    use_cache, as_records, report_all and lazy work the same way as in
+    load_quests.
+
+    Returns: Dictionary of items {item_id: item_data_dict}
     Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
     """
-   # Returns: Dictionary of items {item_id: item_data_dict}
-    # TODO: Implement this function
-    # Must handle same exceptions as load_quests
+    if lazy and not _is_compressed(filename):
+        return LazyCatalog(filename, "items", as_records)
+    if use_cache:
+        items = _load_with_cache(filename, "items", load_items)
+        return _as_records(items, Item) if as_records else items
     items = {}
+    for item_data in iter_items(filename, as_records, report_all):
+        items[item_data['item_id']] = item_data
+    return items
+
+def iter_quests(filename="data/quests.txt", as_records=False, report_all=False):
+    """
+    Stream quests from file one block at a time
     
-    try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            
-    except FileNotFoundError:
-        raise MissingDataFileError(f"Could not find file: {filename}")
-    except:
-        raise CorruptedDataError(f"File {filename} is corrupted or has wrong encoding.")
+    Reads the file line by line and yields each quest as soon as its
+    block is parsed and validated, so the whole file is never in memory.
     
+    If report_all is True, bad blocks are skipped and every error is
+    collected with its line number, then raised together at the end.
+    
+    Yields: Quest data dictionaries (Quest records if as_records is True)
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError,
+            DataValidationError (report_all only)
+    """
+    return _iter_records(filename, parse_quest_block, QUEST_SCHEMA,
+                         Quest if as_records else None, report_all)
 
-    current_block = []
-    for line in lines:
-        line = line.strip()
-        if line:
-            current_block.append(line)
-        elif current_block:
-            item_data = parse_item_block(current_block)
-            validate_item_data(item_data)
-            items[item_data['item_id']] = item_data
-            current_block = []
-            
-    if current_block:
-        item_data = parse_item_block(current_block)
-        validate_item_data(item_data)
-        items[item_data['item_id']] = item_data
+def iter_items(filename="data/items.txt", as_records=False, report_all=False):
+    """
+    Stream items from file one block at a time
+    
+    Yields: Item data dictionaries (Item records if as_records is True)
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError,
+            DataValidationError (report_all only)
+    """
+    return _iter_records(filename, parse_item_block, ITEM_SCHEMA,
+                         Item if as_records else None, report_all)
 
-    return items
+def load_quest_shards(directory="data/quests", max_workers=None):
+    """
+    Load every quest shard (*.txt, *.txt.gz, *.txt.xz) in a directory into one catalog
     
+    Shards are parsed in a process pool; see _load_shards.
+    
+    Returns: Dictionary of quests {quest_id: quest_data_dict}
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    return _load_shards(directory, load_quests, max_workers)
 
-    pass
+def load_item_shards(directory="data/items", max_workers=None):
+    """
+    Load every item shard (*.txt, *.txt.gz, *.txt.xz) in a directory into one catalog
+    
+    Returns: Dictionary of items {item_id: item_data_dict}
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    return _load_shards(directory, load_items, max_workers)
 
 def validate_quest_data(quest_dict):
     """
@@ -136,24 +179,7 @@ def validate_quest_data(quest_dict):
     Returns: True if valid
     Raises: InvalidDataFormatError if missing required fields
     """
-    # TODO: Implement validation
-    # Check that all required keys exist
-    required_fields = [
-        'quest_id', 'title', 'description', 'reward_xp', 
-        'reward_gold', 'required_level', 'prerequisite'
-    ]
-    for field in required_fields:
-        if field not in quest_dict:
-            raise InvalidDataFormatError(f"Missing required quest field: {field}")
-    # Check that numeric values are actually numbers
-    if not isinstance(quest_dict['reward_xp'], int):
-        raise InvalidDataFormatError(f"reward_xp must be an integer")
-    if not isinstance(quest_dict['reward_gold'], int):
-        raise InvalidDataFormatError(f"reward_gold must be an integer")
-    if not isinstance(quest_dict['required_level'], int):
-        raise InvalidDataFormatError(f"required_level must be an integer")
-    return True
-    pass
+    return QUEST_SCHEMA.validate(quest_dict)
 
 def validate_item_data(item_dict):
     """
@@ -165,25 +191,65 @@ def validate_item_data(item_dict):
     Returns: True if valid
     Raises: InvalidDataFormatError if missing required fields or invalid type
     """
-    # TODO: Implement validation
-    required_fields = ['item_id', 'name', 'type', 'effect', 'cost', 'description']
-    valid_types = ['weapon', 'armor', 'consumable']
+    return ITEM_SCHEMA.validate(item_dict)
 
-    # Check missing keys
-    for field in required_fields:
-        if field not in item_dict:
-            raise InvalidDataFormatError(f"Missing required item field")
-            
-    # Check valid type
-    if item_dict['type'] not in valid_types:
-        raise InvalidDataFormatError(f"Invalid item type")
-        
-    # Check numeric cost
-    if not isinstance(item_dict['cost'], int):
-        raise InvalidDataFormatError("Item cost must be an integer")
+class RecordSchema:
+    """
+    Validation rules for one record kind, compiled once into a flat check list
+    
+    Each check is (field, must_be_int, allowed_values). validate() walks the
+    list once and stops at the first problem; errors() walks it once and
+    returns every problem.
+    """
 
-    return True
-    pass
+    def __init__(self, label, fields, int_fields=(), choices=None):
+        choices = choices or {}
+        self.label = label
+        self._checks = tuple((field, field in int_fields, choices.get(field))
+                             for field in fields)
+
+    def errors(self, record):
+        """Return a list of every problem with the record (empty if valid)"""
+        problems = []
+        for field, must_be_int, allowed in self._checks:
+            if field not in record:
+                problems.append(f"Missing required {self.label} field: {field}")
+                continue
+            value = record[field]
+            if must_be_int and not isinstance(value, int):
+                problems.append(f"{self.label} {field} must be an integer")
+            elif allowed is not None and value not in allowed:
+                problems.append(f"Invalid {self.label} {field}: {value}")
+        return problems
+
+    def validate(self, record):
+        """
+        Returns: True if valid
+        Raises: InvalidDataFormatError for the first problem found
+        """
+        for field, must_be_int, allowed in self._checks:
+            if field not in record:
+                raise InvalidDataFormatError(f"Missing required {self.label} field: {field}")
+            value = record[field]
+            if must_be_int and not isinstance(value, int):
+                raise InvalidDataFormatError(f"{self.label} {field} must be an integer")
+            if allowed is not None and value not in allowed:
+                raise InvalidDataFormatError(f"Invalid {self.label} {field}: {value}")
+        return True
+
+QUEST_SCHEMA = RecordSchema(
+    "quest",
+    ('quest_id', 'title', 'description', 'reward_xp',
+     'reward_gold', 'required_level', 'prerequisite'),
+    int_fields=('reward_xp', 'reward_gold', 'required_level')
+)
+
+ITEM_SCHEMA = RecordSchema(
+    "item",
+    ('item_id', 'name', 'type', 'effect', 'cost', 'description'),
+    int_fields=('cost',),
+    choices={'type': ('weapon', 'armor', 'consumable')}
+)
 
 def create_default_data_files():
     """
@@ -239,6 +305,222 @@ DESCRIPTION: An old sword.
 # HELPER FUNCTIONS
 # ============================================================================
 
+def _iter_records(filename, parse_block, schema, record_type, report_all):
+    """
+    Parse and validate every block of a data file
+    
+    Args:
+        filename: Data file to read
+        parse_block: parse_quest_block or parse_item_block
+        schema: QUEST_SCHEMA or ITEM_SCHEMA
+        record_type: Quest/Item to yield slotted records, or None for dicts
+        report_all: Collect every error instead of raising the first
+    
+    Yields: Validated records
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError,
+            DataValidationError (report_all only)
+    """
+    errors = []
+    for line_number, block in _iter_blocks(filename):
+        if not report_all:
+            data = parse_block(block)
+            schema.validate(data)
+        else:
+            try:
+                data = parse_block(block)
+            except InvalidDataFormatError as e:
+                errors.append((line_number, str(e)))
+                continue
+            problems = schema.errors(data)
+            if problems:
+                errors.extend((line_number, problem) for problem in problems)
+                continue
+        yield record_type.from_dict(data) if record_type else data
+
+    if errors:
+        raise DataValidationError(filename, errors)
+
+def _is_compressed(filename):
+    """Return True if filename is a .gz/.xz data file"""
+    return os.path.splitext(filename)[1] in COMPRESSED_OPENERS
+
+def _open_data_file(filename, mode):
+    """
+    Open a data file for streaming, decompressing .gz/.xz transparently
+    
+    Args:
+        filename: Plain, .txt.gz or .txt.xz data file
+        mode: 'r' for text or 'rb' for bytes
+    
+    Returns: File object (compressed files are decoded as they are read,
+             never written out uncompressed)
+    Raises: MissingDataFileError, CorruptedDataError
+    """
+    opener = COMPRESSED_OPENERS.get(os.path.splitext(filename)[1], open)
+    encoding = 'utf-8' if mode == 'r' else None
+    if opener is not open and mode == 'r':
+        mode = 'rt'
+    try:
+        return opener(filename, mode, encoding=encoding)
+    except FileNotFoundError:
+        raise MissingDataFileError(f"Could not find file: {filename}")
+    except (OSError, *_DECODE_ERRORS):
+        raise CorruptedDataError(f"File {filename} is corrupted or has wrong encoding.")
+
+def _iter_blocks(filename):
+    """
+    Read a data file line by line and yield its blank-line separated blocks
+    
+    Yields: Tuples of (starting line number, list of stripped lines)
+    Raises: MissingDataFileError, CorruptedDataError
+    """
+    f = _open_data_file(filename, 'r')
+
+    with f:
+        current_block = []
+        start_line = 0
+        try:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if line:
+                    if not current_block:
+                        start_line = line_number
+                    current_block.append(line)
+                elif current_block:
+                    # Blank line ends the block
+                    yield start_line, current_block
+                    current_block = []
+        except _DECODE_ERRORS:
+            raise CorruptedDataError(f"File {filename} is corrupted or has wrong encoding.")
+
+        # Process the final block if the file didn't end with a blank line
+        if current_block:
+            yield start_line, current_block
+
+def _load_shards(directory, loader, max_workers=None):
+    """
+    Parse shard files in parallel and merge them in filename order
+    
+    Args:
+        directory: Directory containing shards matching SHARD_PATTERNS
+        loader: load_quests or load_items (run in the worker processes)
+        max_workers: Pool size; 1 parses in this process
+    
+    Returns: Merged dictionary of records
+    Raises:
+        MissingDataFileError if the directory has no shards
+        InvalidDataFormatError for bad data or IDs defined in several shards
+        CorruptedDataError for unreadable shards
+    """
+    shards = sorted(shard for pattern in SHARD_PATTERNS
+                    for shard in glob.glob(os.path.join(directory, pattern)))
+    if not shards:
+        raise MissingDataFileError(f"No data shards found in: {directory}")
+
+    if max_workers == 1 or len(shards) == 1:
+        results = map(loader, shards)
+        return _merge_shards(shards, results)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return _merge_shards(shards, pool.map(loader, shards))
+
+def _merge_shards(shards, results):
+    """Merge per-shard dictionaries, collecting IDs that appear more than once"""
+    merged = {}
+    origin = {}
+    duplicates = {}
+    results = iter(results)
+    for shard in shards:
+        try:
+            records = next(results)
+        except (MissingDataFileError, InvalidDataFormatError, CorruptedDataError) as e:
+            # Say which shard failed; the exception itself is unchanged
+            e.source = shard
+            raise
+        for record_id, record in records.items():
+            if record_id in merged:
+                duplicates.setdefault(record_id, [origin[record_id]]).append(shard)
+                continue
+            merged[record_id] = record
+            origin[record_id] = shard
+
+    if duplicates:
+        report = "; ".join(f"{record_id} in {', '.join(files)}"
+                           for record_id, files in sorted(duplicates.items()))
+        raise InvalidDataFormatError(f"Duplicate IDs across shards: {report}")
+    return merged
+
+def _file_hash(filename):
+    """Return the sha256 hex digest of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _load_with_cache(filename, kind, loader):
+    """
+    Load a catalog through its compiled cache file
+    
+    The cache is keyed on the source's size, mtime and content hash.
+    Size and mtime are checked first; the hash is only recomputed when the
+    mtime changed, so a touched-but-identical file still hits the cache.
+    Records in the cache were validated when it was written.
+    
+    Args:
+        filename: Source data file
+        kind: "quests" or "items", stored in the cache header
+        loader: Uncached load function used on a miss
+    
+    Returns: Dictionary of records
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    try:
+        stat = os.stat(filename)
+    except FileNotFoundError:
+        raise MissingDataFileError(f"Could not find file: {filename}")
+    cache_path = filename + CACHE_SUFFIX
+
+    cached = None
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+    except Exception:
+        # Missing or unreadable cache is just a miss
+        cached = None
+
+    if (isinstance(cached, dict) and cached.get('version') == CACHE_VERSION
+            and cached.get('kind') == kind and cached.get('size') == stat.st_size):
+        if cached.get('mtime_ns') == stat.st_mtime_ns:
+            return cached['records']
+        content_hash = _file_hash(filename)
+        if cached.get('sha256') == content_hash:
+            cached['mtime_ns'] = stat.st_mtime_ns
+            _write_cache(cache_path, cached)
+            return cached['records']
+
+    content_hash = _file_hash(filename)
+    records = loader(filename)
+    _write_cache(cache_path, {
+        'version': CACHE_VERSION,
+        'kind': kind,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'sha256': content_hash,
+        'records': records
+    })
+    return records
+
+def _write_cache(cache_path, payload):
+    """Atomically write a cache file; failures only cost the next cold start"""
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
 def parse_quest_block(lines):
     """
     Parse a block of lines into a quest dictionary
@@ -304,6 +586,14 @@ def parse_item_block(lines):
                 if not value.isdigit():
                     raise InvalidDataFormatError(f"Value for cost must be a number")
                 value = int(value)
+            # Parse effects once here so item use never re-splits the string.
+            # An unparseable effect still loads, with no effects, so use_item
+            # reports "invalid effect data" as it did before pre-parsing.
+            elif key == 'effect':
+                try:
+                    data['effects'] = parse_effect_string(value)
+                except InvalidDataFormatError:
+                    data['effects'] = ()
                 
             data[key] = value
             
@@ -313,6 +603,807 @@ def parse_item_block(lines):
     return data
     pass
 
+def parse_effect_string(effect_string):
+    """
+    Parse an EFFECT value into a tuple of (stat_name, value) pairs
+    
+    Args:
+        effect_string: "stat:value", or several joined by commas for
+                       multi-stat items (e.g. "strength:5,magic:3")
+    
+    Returns: Tuple of (stat_name, int value) tuples
+    Raises: InvalidDataFormatError if any effect is malformed
+    """
+    effects = []
+    for part in effect_string.split(','):
+        stat_name, separator, value = part.partition(':')
+        stat_name = stat_name.strip()
+        try:
+            # int() like the original parser, so "+5" is still accepted
+            value = int(value)
+        except ValueError:
+            value = None
+        if not separator or not stat_name or value is None:
+            raise InvalidDataFormatError(f"Invalid item effect: {effect_string}")
+        effects.append((stat_name, value))
+    return tuple(effects)
+
+# ============================================================================
+# RECORD TYPES
+# ============================================================================
+
+class _SlottedRecord(Mapping):
+    """
+    Compact read-only record with a dict-compatible read path
+    
+    Known fields live in __slots__ instead of a per-record dict. Any extra
+    keys from the data file are kept in a small overflow dict (or None).
+    Supports record['key'], record.get(), 'key' in record, keys/items/values,
+    equality with plain dicts, and copy() which returns a plain dict.
+    """
+    __slots__ = ('_extra',)
+    _fields = ()
+
+    def __init__(self, *values, **extra):
+        for field, value in zip(self._fields, values):
+            object.__setattr__(self, field, value)
+        object.__setattr__(self, '_extra', extra or None)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from a parsed data dictionary"""
+        extra = {key: value for key, value in data.items() if key not in cls._fields}
+        return cls(*[data[field] for field in cls._fields], **extra)
+
+    def __getitem__(self, key):
+        if key in self._fields:
+            return getattr(self, key)
+        if self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self._fields or bool(self._extra and key in self._extra)
+
+    def __iter__(self):
+        yield from self._fields
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self):
+        return len(self._fields) + (len(self._extra) if self._extra else 0)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} records are read-only")
+
+    def __reduce__(self):
+        return (_rebuild_record, (type(self), tuple(getattr(self, f) for f in self._fields),
+                                  self._extra))
+
+    def copy(self):
+        """Return a plain, mutable dict copy of the record"""
+        return dict(self.items())
+
+    def to_dict(self):
+        """Return the record as a plain dict"""
+        return self.copy()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.copy()!r})"
+
+class Quest(_SlottedRecord):
+    """Slotted quest record with the fields validated by validate_quest_data"""
+    __slots__ = ('quest_id', 'title', 'description', 'reward_xp',
+                 'reward_gold', 'required_level', 'prerequisite')
+    _fields = __slots__
+
+class Item(_SlottedRecord):
+    """Slotted item record with the fields validated by validate_item_data"""
+    __slots__ = ('item_id', 'name', 'type', 'effect', 'cost', 'description', 'effects')
+    _fields = __slots__
+
+def _rebuild_record(record_type, values, extra):
+    """Pickle helper for slotted records"""
+    return record_type(*values, **(extra or {}))
+
+def _as_records(records, record_type):
+    """Convert a dictionary of plain dict records to slotted records"""
+    return {record_id: record_type.from_dict(data) for record_id, data in records.items()}
+
+# ============================================================================
+# LAZY CATALOG
+# ============================================================================
+
+class LazyCatalog(MutableMapping):
+    """
+    Catalog mapping that parses each record the first time it is accessed
+    
+    Construction makes one pass over the file recording each block's byte
+    offset, length and ID (read from its QUEST_ID/ITEM_ID line). A block is
+    parsed and validated on first access through catalog[key], get() or
+    items(), and the result is kept. Assigning or deleting keys works like a
+    dict, so hot reload diffs can be applied to it.
+    
+    Meant for plain files only; load_quests and load_items load compressed
+    files eagerly even when lazy=True.
+    """
+
+    def __init__(self, filename, kind, as_records=False):
+        self.filename = filename
+        self.kind = kind
+        self._id_field = _record_id_field(kind)
+        self._record_type = (Quest if kind == "quests" else Item) if as_records else None
+        self._parsed = {}
+        self._spans, self._stat_key = self._scan()
+
+    def _scan(self):
+        """
+        Find (offset, length) of every block keyed by its ID
+        
+        Returns: Tuple of (spans dict, (size, mtime_ns) of the scanned file)
+        """
+        spans = {}
+        f = _open_data_file(self.filename, 'rb')
+        stat = os.fstat(f.fileno())
+
+        prefix = self._id_field.upper().encode('utf-8') + b": "
+        with f:
+            offset = 0
+            block_start = None
+            block_id = None
+            for raw_line in self._read_lines(f):
+                line = raw_line.strip()
+                if line:
+                    if block_start is None:
+                        block_start = offset
+                    if block_id is None and line[:len(prefix)].upper() == prefix:
+                        block_id = self._decode(line[len(prefix):]).strip()
+                elif block_start is not None:
+                    self._add_span(spans, block_id, block_start, offset)
+                    block_start = None
+                    block_id = None
+                offset += len(raw_line)
+            if block_start is not None:
+                self._add_span(spans, block_id, block_start, offset)
+        return spans, (stat.st_size, stat.st_mtime_ns)
+
+    def _read_lines(self, f):
+        """Yield raw lines, turning codec errors into CorruptedDataError"""
+        try:
+            yield from f
+        except _DECODE_ERRORS:
+            raise CorruptedDataError(f"File {self.filename} is corrupted or has wrong encoding.")
+
+    def _decode(self, raw):
+        try:
+            return raw.decode('utf-8')
+        except UnicodeDecodeError:
+            raise CorruptedDataError(f"File {self.filename} is corrupted or has wrong encoding.")
+
+    def _add_span(self, spans, block_id, start, end):
+        if block_id is None:
+            raise InvalidDataFormatError(
+                f"Block at byte {start} is missing its {self._id_field.upper()} line")
+        spans[block_id] = (start, end - start)
+
+    def _refresh_spans(self):
+        """
+        Re-scan offsets for unparsed records if the file was edited
+        
+        Unparsed IDs that are no longer in the file are dropped, so their
+        old offsets can never be read as some other block. Parsed and
+        assigned records are kept; hot reload diffs replace or delete them.
+        """
+        try:
+            stat = os.stat(self.filename)
+        except FileNotFoundError:
+            raise MissingDataFileError(f"Could not find file: {self.filename}")
+        if (stat.st_size, stat.st_mtime_ns) == self._stat_key:
+            return
+        spans, self._stat_key = self._scan()
+        for record_id in list(self._spans):
+            if record_id in self._parsed:
+                continue
+            if record_id in spans:
+                self._spans[record_id] = spans[record_id]
+            else:
+                del self._spans[record_id]
+
+    def _load(self, record_id):
+        """Parse and validate one block"""
+        start, length = self._spans[record_id]
+        with _open_data_file(self.filename, 'rb') as f:
+            try:
+                f.seek(start)
+                raw = f.read(length)
+            except _DECODE_ERRORS:
+                raise CorruptedDataError(f"File {self.filename} is corrupted or has wrong encoding.")
+            text = self._decode(raw)
+        block = [line.strip() for line in text.splitlines() if line.strip()]
+        parse_block, validate_record = _record_handlers(self.kind)
+        data = parse_block(block)
+        validate_record(data)
+        return self._record_type.from_dict(data) if self._record_type else data
+
+    def __getitem__(self, record_id):
+        if record_id in self._parsed:
+            return self._parsed[record_id]
+        self._refresh_spans()
+        if record_id not in self._spans:
+            raise KeyError(record_id)
+        record = self._load(record_id)
+        self._parsed[record_id] = record
+        return record
+
+    def __setitem__(self, record_id, record):
+        if record_id not in self._spans:
+            self._spans[record_id] = None
+        self._parsed[record_id] = record
+
+    def __delitem__(self, record_id):
+        # Never parses: a deleted block may no longer be at its old offset
+        del self._spans[record_id]
+        self._parsed.pop(record_id, None)
+
+    def pop(self, record_id, *default):
+        """
+        Remove a record without parsing it
+        
+        Returns: The record if it had been parsed, otherwise default (or
+        None); raises KeyError for an unknown ID when no default is given
+        """
+        if record_id in self:
+            record = self._parsed.get(record_id)
+            del self[record_id]
+            if record is not None:
+                return record
+            return default[0] if default else None
+        if default:
+            return default[0]
+        raise KeyError(record_id)
+
+    def __contains__(self, record_id):
+        if record_id in self._parsed:
+            return True
+        self._refresh_spans()
+        return record_id in self._spans
+
+    def __iter__(self):
+        self._refresh_spans()
+        return iter(self._spans)
+
+    def __len__(self):
+        self._refresh_spans()
+        return len(self._spans)
+
+    def parsed_count(self):
+        """Return how many records have been parsed so far"""
+        return len(self._parsed)
+
+# ============================================================================
+# CATALOG INDEXES
+# ============================================================================
+
+class _IndexedCatalog(MutableMapping):
+    """
+    Mapping of records with secondary indexes for common queries
+    
+    Wraps any mapping of records (a dict, a LazyCatalog, ...). Indexes are
+    built in one pass the first time they are needed (or by calling
+    build_indexes()) and kept up to date when records are assigned or
+    deleted, so indexed queries cost O(result) instead of a catalog scan.
+    """
+
+    def __init__(self, records=None):
+        self._records = records if records is not None else {}
+        self._indexed = False
+
+    def build_indexes(self):
+        """Build every index now; returns self"""
+        self._indexed = False
+        self._reset_indexes()
+        for record_id, record in self._records.items():
+            self._index(record_id, record)
+        self._finish_indexes()
+        self._indexed = True
+        return self
+
+    def _finish_indexes(self):
+        """Hook run once after a full build (e.g. to sort in one pass)"""
+
+    def _ensure_indexes(self):
+        if not self._indexed:
+            self.build_indexes()
+
+    def __getitem__(self, record_id):
+        return self._records[record_id]
+
+    def __setitem__(self, record_id, record):
+        if self._indexed and record_id in self._records:
+            self._unindex(record_id, self._records[record_id])
+        self._records[record_id] = record
+        if self._indexed:
+            self._index(record_id, record)
+
+    def __delitem__(self, record_id):
+        if self._indexed:
+            self._unindex(record_id, self._records[record_id])
+        # Without indexes there is nothing to unindex, so a lazy record is
+        # removed without being parsed
+        del self._records[record_id]
+
+    def __contains__(self, record_id):
+        return record_id in self._records
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __len__(self):
+        return len(self._records)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({len(self)} records)"
+
+class ItemCatalog(_IndexedCatalog):
+    """
+    Item catalog indexed by type and by cost
+    
+    Indexes: item IDs per type, and a (cost, item_id) list kept sorted.
+    """
+
+    def _reset_indexes(self):
+        self._by_type = {}
+        self._by_cost = []
+
+    def _index(self, item_id, item):
+        self._by_type.setdefault(item['type'], {})[item_id] = None
+        if self._indexed:
+            bisect.insort(self._by_cost, (item['cost'], item_id))
+        else:
+            # Full build: append now, sort once in _finish_indexes
+            self._by_cost.append((item['cost'], item_id))
+
+    def _finish_indexes(self):
+        self._by_cost.sort()
+
+    def _unindex(self, item_id, item):
+        self._by_type.get(item['type'], {}).pop(item_id, None)
+        position = bisect.bisect_left(self._by_cost, (item['cost'], item_id))
+        if position < len(self._by_cost) and self._by_cost[position] == (item['cost'], item_id):
+            del self._by_cost[position]
+
+    def ids_by_type(self, item_type):
+        """Return the IDs of all items of one type"""
+        self._ensure_indexes()
+        return list(self._by_type.get(item_type, ()))
+
+    def ids_by_cost(self, min_cost=None, max_cost=None):
+        """Return item IDs sorted by cost, optionally within a cost range"""
+        self._ensure_indexes()
+        low = 0 if min_cost is None else bisect.bisect_left(self._by_cost, (min_cost,))
+        high = (len(self._by_cost) if max_cost is None
+                else bisect.bisect_left(self._by_cost, (max_cost + 1,)))
+        return [item_id for cost, item_id in self._by_cost[low:high]]
+
+class QuestCatalog(_IndexedCatalog):
+    """
+    Quest catalog indexed by required level and by prerequisite
+    
+    Indexes: quest IDs per required_level (with a sorted list of levels for
+    range queries), and prerequisite -> child quest IDs adjacency.
+    """
+
+    def _reset_indexes(self):
+        self._by_level = {}
+        self._levels = []
+        self._children = {}
+
+    def _index(self, quest_id, quest):
+        level = quest['required_level']
+        if level not in self._by_level:
+            self._by_level[level] = {}
+            bisect.insort(self._levels, level)
+        self._by_level[level][quest_id] = None
+        self._children.setdefault(quest['prerequisite'], {})[quest_id] = None
+
+    def _unindex(self, quest_id, quest):
+        level = quest['required_level']
+        level_ids = self._by_level.get(level, {})
+        level_ids.pop(quest_id, None)
+        if not level_ids and level in self._by_level:
+            del self._by_level[level]
+            self._levels.remove(level)
+        self._children.get(quest['prerequisite'], {}).pop(quest_id, None)
+
+    def ids_by_level(self, min_level, max_level):
+        """Return IDs of quests whose required_level is within the range"""
+        self._ensure_indexes()
+        low = bisect.bisect_left(self._levels, min_level)
+        high = bisect.bisect_right(self._levels, max_level)
+        ids = []
+        for level in self._levels[low:high]:
+            ids.extend(self._by_level[level])
+        return ids
+
+    def children_of(self, quest_id):
+        """Return IDs of quests that have quest_id as their prerequisite"""
+        self._ensure_indexes()
+        return list(self._children.get(quest_id, ()))
+
+def load_quest_catalog(filename="data/quests.txt", **options):
+    """
+    Load quests into a QuestCatalog with its indexes built
+    
+    Takes the same options as load_quests.
+    """
+    return QuestCatalog(load_quests(filename, **options)).build_indexes()
+
+def load_item_catalog(filename="data/items.txt", **options):
+    """
+    Load items into an ItemCatalog with its indexes built
+    
+    Takes the same options as load_items. With lazy=True the indexes are
+    left to be built on the first indexed query instead.
+    """
+    catalog = ItemCatalog(load_items(filename, **options))
+    return catalog if options.get('lazy') else catalog.build_indexes()
+
+# ============================================================================
+# INDEXED CATALOG FORMAT
+# ============================================================================
+
+def compile_catalog(records, filename):
+    """
+    Write a catalog to the indexed binary format
+    
+    Layout: header, record bodies, key bytes, then a fixed-size index of
+    (key offset, key length, record offset, record length) sorted by key.
+    The sorted index lets open_catalog binary-search one record without
+    reading the rest of the file.
+    
+    Args:
+        records: Dictionary {record_id: record_dict}, e.g. from load_items()
+        filename: Path of the catalog file to write
+    
+    Returns: Number of records written
+    """
+    temp_path = f"{filename}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        count = _write_catalog(f, records)
+    os.replace(temp_path, filename)
+    return count
+
+def _write_catalog(f, records):
+    """Write the indexed catalog layout to a seekable binary file object"""
+    keys = sorted(records, key=lambda record_id: str(record_id).encode('utf-8'))
+    f.write(b"\x00" * _CATALOG_HEADER.size)
+    record_spans = []
+    for record_id in keys:
+        body = pickle.dumps(records[record_id], protocol=pickle.HIGHEST_PROTOCOL)
+        record_spans.append((f.tell(), len(body)))
+        f.write(body)
+
+    key_spans = []
+    for record_id in keys:
+        key_bytes = str(record_id).encode('utf-8')
+        key_spans.append((f.tell(), len(key_bytes)))
+        f.write(key_bytes)
+
+    index_offset = f.tell()
+    for (key_off, key_len), (rec_off, rec_len) in zip(key_spans, record_spans):
+        f.write(_CATALOG_ENTRY.pack(key_off, key_len, rec_off, rec_len))
+
+    f.seek(0)
+    f.write(_CATALOG_HEADER.pack(CATALOG_MAGIC, CATALOG_VERSION, len(keys), index_offset))
+    return len(keys)
+
+def open_catalog(filename):
+    """
+    Open an indexed binary catalog with mmap for random-access lookups
+    
+    Returns: MappedCatalog (read-only mapping of record_id -> record dict)
+    Raises: MissingDataFileError, CorruptedDataError
+    """
+    try:
+        f = open(filename, 'rb')
+    except FileNotFoundError:
+        raise MissingDataFileError(f"Could not find file: {filename}")
+    with f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise CorruptedDataError(f"Catalog {filename} is empty.")
+    try:
+        return MappedCatalog(mapped)
+    except CorruptedDataError:
+        mapped.close()
+        raise
+
+class MappedCatalog(Mapping):
+    """
+    Read-only mapping over an indexed binary catalog buffer
+    
+    Only the header is decoded up front; each lookup binary-searches the
+    index and unpickles a single record. Works over any buffer (an mmap or
+    a shared memory block). owner is closed along with the catalog.
+    """
+
+    def __init__(self, buffer, owner=None):
+        # Check the header before taking a view so a bad buffer can be closed
+        if len(buffer) < _CATALOG_HEADER.size:
+            raise CorruptedDataError("Catalog buffer is too small.")
+        magic, version, count, index_offset = _CATALOG_HEADER.unpack_from(buffer, 0)
+        if magic != CATALOG_MAGIC or version != CATALOG_VERSION:
+            raise CorruptedDataError("Catalog has an unknown format or version.")
+        if index_offset + count * _CATALOG_ENTRY.size > len(buffer):
+            raise CorruptedDataError("Catalog index is truncated.")
+        self._buffer = buffer
+        self._owner = owner
+        self._view = memoryview(buffer)
+        self._count = count
+        self._index_offset = index_offset
+
+    def _entry(self, position):
+        return _CATALOG_ENTRY.unpack_from(
+            self._view, self._index_offset + position * _CATALOG_ENTRY.size)
+
+    def _key_bytes(self, position):
+        key_off, key_len, rec_off, rec_len = self._entry(position)
+        return bytes(self._view[key_off:key_off + key_len])
+
+    def _find(self, record_id):
+        """Binary search the sorted index; returns position or -1"""
+        target = str(record_id).encode('utf-8')
+        low, high = 0, self._count - 1
+        while low <= high:
+            middle = (low + high) // 2
+            key = self._key_bytes(middle)
+            if key == target:
+                return middle
+            if key < target:
+                low = middle + 1
+            else:
+                high = middle - 1
+        return -1
+
+    def __getitem__(self, record_id):
+        position = self._find(record_id)
+        if position < 0:
+            raise KeyError(record_id)
+        key_off, key_len, rec_off, rec_len = self._entry(position)
+        try:
+            return pickle.loads(self._view[rec_off:rec_off + rec_len])
+        except Exception:
+            raise CorruptedDataError(f"Catalog record '{record_id}' is corrupted.")
+
+    def __contains__(self, record_id):
+        return self._find(record_id) >= 0
+
+    def __iter__(self):
+        for position in range(self._count):
+            yield self._key_bytes(position).decode('utf-8')
+
+    def __len__(self):
+        return self._count
+
+    def close(self):
+        """Release the underlying buffer"""
+        self._view.release()
+        if isinstance(self._buffer, memoryview):
+            self._buffer.release()
+        elif hasattr(self._buffer, 'close'):
+            self._buffer.close()
+        if self._owner is not None:
+            self._owner.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+# ============================================================================
+# SHARED MEMORY CATALOG
+# ============================================================================
+
+def publish_catalog(records, name=None):
+    """
+    Copy a catalog into one shared memory block for worker processes
+    
+    The block holds the indexed catalog layout (see compile_catalog), so
+    workers can attach and look up records without their own copy.
+    
+    Args:
+        records: Dictionary of records, e.g. from load_items()
+        name: Optional shared memory name (generated if None)
+    
+    Returns: PublishedCatalog; pass its .name to attach_catalog() in workers
+    """
+    buffer = io.BytesIO()
+    _write_catalog(buffer, records)
+    data = buffer.getbuffer()
+    block = shared_memory.SharedMemory(name=name, create=True, size=max(len(data), 1))
+    block.buf[:len(data)] = data
+    data.release()
+    return PublishedCatalog(block)
+
+def attach_catalog(name):
+    """
+    Attach read-only to a catalog published with publish_catalog()
+    
+    Returns: MappedCatalog backed by the shared block
+    Raises: MissingDataFileError if no block has that name,
+            CorruptedDataError if the block is not a catalog
+    """
+    try:
+        if sys.version_info >= (3, 13):
+            block = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            block = shared_memory.SharedMemory(name=name)
+            # Only the publisher should unlink the block when it exits
+            resource_tracker.unregister(block._name, "shared_memory")
+    except FileNotFoundError:
+        raise MissingDataFileError(f"No shared catalog named: {name}")
+    try:
+        return MappedCatalog(block.buf.toreadonly(), owner=block)
+    except CorruptedDataError:
+        block.close()
+        raise
+
+class PublishedCatalog:
+    """
+    Publisher's handle on a shared memory catalog
+    
+    Keep it alive while workers use the catalog, then call unlink() (or use
+    it as a context manager) to free the block.
+    """
+
+    def __init__(self, block):
+        self._block = block
+        self.name = block.name
+        self.size = block.size
+
+    def unlink(self):
+        """Close and remove the shared block"""
+        self._block.close()
+        self._block.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.unlink()
+
+# ============================================================================
+# HOT RELOAD
+# ============================================================================
+
+class DataFileWatcher:
+    """
+    Watch one quest or item file and re-parse only the blocks that changed
+    
+    The watcher remembers a hash of every block's text. On poll() it checks
+    the file's size/mtime, and if it changed, re-reads the blocks and only
+    parses and validates blocks whose text hash is new.
+    """
+
+    def __init__(self, filename, kind):
+        """
+        Args:
+            filename: Data file to watch
+            kind: "quests" or "items"
+        """
+        self.filename = filename
+        self.kind = kind
+        self._id_field = _record_id_field(kind)
+        self._stat_key = None
+        self._hash_to_id = {}
+        self.snapshot()
+
+    def snapshot(self):
+        """Record the current file state without parsing any blocks"""
+        self._stat_key = self._current_stat_key()
+        self._hash_to_id = {}
+        for line_number, block in _iter_blocks(self.filename):
+            self._hash_to_id[_block_hash(block)] = _block_id(block, self._id_field)
+
+    def _current_stat_key(self):
+        try:
+            stat = os.stat(self.filename)
+        except FileNotFoundError:
+            raise MissingDataFileError(f"Could not find file: {self.filename}")
+        return (stat.st_size, stat.st_mtime_ns)
+
+    def has_changed(self):
+        """Return True if the file's size or mtime differs from the snapshot"""
+        return self._current_stat_key() != self._stat_key
+
+    def poll(self):
+        """
+        Re-read the file if it changed and diff it block by block
+        
+        Returns: None if unchanged, otherwise a diff dictionary:
+            {'added': [ids], 'modified': [ids], 'removed': [ids],
+             'records': {id: record for added and modified ids}}
+        Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+        """
+        stat_key = self._current_stat_key()
+        if stat_key == self._stat_key:
+            return None
+
+        parse_block, validate_record = _record_handlers(self.kind)
+        old_ids = set(self._hash_to_id.values())
+        new_hash_to_id = {}
+        records = {}
+        for line_number, block in _iter_blocks(self.filename):
+            block_hash = _block_hash(block)
+            if block_hash in self._hash_to_id:
+                new_hash_to_id[block_hash] = self._hash_to_id[block_hash]
+                continue
+            record = parse_block(block)
+            validate_record(record)
+            record_id = record[self._id_field]
+            new_hash_to_id[block_hash] = record_id
+            records[record_id] = record
+
+        new_ids = set(new_hash_to_id.values())
+        diff = {
+            'added': sorted(record_id for record_id in records if record_id not in old_ids),
+            'modified': sorted(record_id for record_id in records if record_id in old_ids),
+            'removed': sorted(old_ids - new_ids),
+            'records': records
+        }
+        # Only commit the new state once the whole file parsed cleanly
+        self._hash_to_id = new_hash_to_id
+        self._stat_key = stat_key
+        return diff
+
+def apply_data_diff(catalog, diff):
+    """
+    Apply a DataFileWatcher diff to a loaded catalog in place
+    
+    Returns: The same catalog object
+    """
+    for record_id in diff['removed']:
+        # del rather than pop, so a removed lazy record is never parsed
+        if record_id in catalog:
+            del catalog[record_id]
+    for record_id, record in diff['records'].items():
+        catalog[record_id] = record
+    return catalog
+
+def _record_id_field(kind):
+    """Return the ID field name for a catalog kind"""
+    if kind == "quests":
+        return 'quest_id'
+    if kind == "items":
+        return 'item_id'
+    raise ValueError(f"Unknown catalog kind: {kind}")
+
+def _record_handlers(kind):
+    """Return (parse_block, validate_record) for a catalog kind"""
+    if kind == "quests":
+        return parse_quest_block, validate_quest_data
+    if kind == "items":
+        return parse_item_block, validate_item_data
+    raise ValueError(f"Unknown catalog kind: {kind}")
+
+def _block_hash(block):
+    """Hash the text of a block for change detection"""
+    return hashlib.blake2b("\n".join(block).encode('utf-8'), digest_size=16).digest()
+
+def _block_id(block, id_field):
+    """
+    Find a block's ID without parsing the rest of it
+    
+    Raises: InvalidDataFormatError if the block has no ID line
+    """
+    prefix = id_field.upper() + ": "
+    for line in block:
+        if line[:len(prefix)].upper() == prefix:
+            return line[len(prefix):].strip()
+    raise InvalidDataFormatError(f"Block is missing its {id_field.upper()} line")
+
 # ============================================================================
 # TESTING
 # ============================================================================
@@ -13,8 +13,10 @@ from custom_exceptions import (
     InventoryFullError,
     ItemNotFoundError,
     InsufficientResourcesError,
-    InvalidItemTypeError
+    InvalidItemTypeError,
+    InvalidDataFormatError
 )
+from game_data import parse_effect_string
 
 # Maximum inventory size
 MAX_INVENTORY_SIZE = 20
@@ -145,24 +147,22 @@ def use_item(character, item_id, item_data):
     # Check if item type is 'consumable'
     if item_data.get('type') != 'consumable':
         raise InvalidItemTypeError(f"{item_data} cannot be used.")
-    # Parse effect (format: "stat_name:value" e.g., "health:20")
-    effect_str = item_data.get('effect', '')
-
-    try:
-        stat_name, value = effect_str.split(':')
-        value = int(value)
-    except ValueError:
+    # Effects are pre-parsed by game_data.load_items
+    effects = get_item_effects(item_data)
+    if not effects:
         return f"Item {item_id} has invalid effect data."
 
-    # Apply effect to character
-    current_stat = character.get(stat_name, 0)
-    character[stat_name] = current_stat + value
+    # Apply effects to character
+    for stat_name, value in effects:
+        current_stat = character.get(stat_name, 0)
+        character[stat_name] = current_stat + value
     # Remove item from inventory
     remove_item_from_inventory(character, item_id)
-    return f"Used {item_id}. {stat_name} increased by {value}."
+    changes = ", ".join(f"{stat_name} increased by {value}" for stat_name, value in effects)
+    return f"Used {item_id}. {changes}."
     pass
 
-def equip_weapon(character, item_id, item_data):
+def equip_weapon(character, item_id, item_data, item_data_dict=None):
     #AI Use: Google Gemini was used to handle unequipping current weapon if exists
 
     # TODO: Implement weapon equipping
@@ -175,30 +175,20 @@ def equip_weapon(character, item_id, item_data):
         raise InvalidItemTypeError(f"Item '{item_id}' is not a weapon")
 
     # If the character already has a weapon equipped, unequip weapon
-    old_weapon_id = character.get("equipped_weapon")
-    if old_weapon_id:
-        unequip_weapon(character)
-        character["inventory"].append(old_weapon_id)
+    _take_from_inventory_for_swap(character, item_id, "equipped_weapon",
+                                  unequip_weapon, item_data_dict)
 
     # Equip the new weapon
     character["equipped_weapon"] = item_id
 
     # Apply weapon effects 
-    effect = item_data.get("effect")
-    if effect:
-        stat, value = effect.split(":")
-        value = int(value)
-        if stat in character:
-            character[stat] += value
-
-    # Remove the weapon from inventory 
-    character["inventory"].remove(item_id)
+    _apply_item_effects(character, get_item_effects(item_data), 1)
 
     return f"{character['name']} has equipped {item_id}"
     
     
 
-def equip_armor(character, item_id, item_data):
+def equip_armor(character, item_id, item_data, item_data_dict=None):
     # TODO: Implement armor equipping
     # Similar to equip_weapon but for armor
     if item_id not in character["inventory"]:
@@ -210,30 +200,34 @@ def equip_armor(character, item_id, item_data):
     if item["type"] != "armor":
         raise InvalidItemTypeError(f"Item '{item_id}' is not armor")
 
-    # If armor already equipped, remove its effect 
-    if character.get("equipped_armor"):
-        old_armor = character["equipped_armor"]
-        old_data = item_data[old_armor]
-        stat, value = old_data["effect"].split(":")
-        character[stat] -= int(value)
-
-        # Return old armor to inventory
-        character["inventory"].append(old_armor)
+    # If armor already equipped, remove its effect and return it to inventory
+    _take_from_inventory_for_swap(character, item_id, "equipped_armor",
+                                  unequip_armor, item_data_dict)
 
     # Apply new armor effect
-    stat, value = item["effect"].split(":")
-    character[stat] += int(value)
+    effects = get_item_effects(item)
+    _apply_item_effects(character, effects, 1)
 
     # Set equipped armor
     character["equipped_armor"] = item_id
 
-    # Remove from inventory
-    character["inventory"].remove(item_id)
+    changes = ", ".join(f"{stat} increased by {value}" for stat, value in effects)
+    return f"Equipped {item_id}, {changes}"
 
-    return f"Equipped {item_id}, {stat} increased by {value}"
-
-def unequip_weapon(character):
-   
+def unequip_weapon(character, item_data_dict=None):
+    """
+    Remove equipped weapon and return it to inventory
+    
+    Args:
+        character: Character dictionary
+        item_data_dict: Dictionary of all item data, used to undo the
+                        weapon's stat effects
+    
+    Returns: Item ID that was unequipped, or None if no weapon equipped
+    Raises:
+        InventoryFullError if inventory is full
+        ItemNotFoundError if the weapon's item data is not available
+    """
     # TODO: Implement weapon unequipping
     equipped = character.get("equipped_weapon")
     # Check if weapon is equipped
@@ -242,10 +236,8 @@ def unequip_weapon(character):
     if get_inventory_space_remaining(character) <= 0:
         raise InventoryFullError("Inventory is full")
 
-    weapon_data = item_data[equipped]
-    stat, value = weapon_data["effect"].split(":")
     # Remove stat bonuses
-    character[stat] -= int(value)  
+    _apply_item_effects(character, get_item_effects(_equipped_item_data(equipped, item_data_dict)), -1)
 
     # Add weapon back to inventory
     character["inventory"].append(equipped)
@@ -254,12 +246,19 @@ def unequip_weapon(character):
 
     return equipped
 
-def unequip_armor(character):
+def unequip_armor(character, item_data_dict=None):
     """
     Remove equipped armor and return it to inventory
     
+    Args:
+        character: Character dictionary
+        item_data_dict: Dictionary of all item data, used to undo the
+                        armor's stat effects
+    
     Returns: Item ID that was unequipped, or None if no armor equipped
-    Raises: InventoryFullError if inventory is full
+    Raises:
+        InventoryFullError if inventory is full
+        ItemNotFoundError if the armor's item data is not available
     """
     # TODO: Implement armor unequipping
     equipped = character.get("equipped_armor")
@@ -270,16 +269,46 @@ def unequip_armor(character):
     if get_inventory_space_remaining(character) <= 0:
         raise InventoryFullError("Inventory is full")
 
-    armor_data = item_data[equipped]
-    stat, value = armor_data["effect"].split(":")
     # Remove stat bonuses
-    character[stat] -= int(value)
+    _apply_item_effects(character, get_item_effects(_equipped_item_data(equipped, item_data_dict)), -1)
 
     character["inventory"].append(equipped)
     # Clear equipped status
     character["equipped_armor"] = None
 
     return equipped
+
+def _take_from_inventory_for_swap(character, item_id, slot, unequip, item_data_dict):
+    """
+    Remove an item being equipped from the inventory and unequip the old one
+    
+    The new item leaves the inventory first so the old one has room to
+    come back. If unequipping fails, the new item is put back where it was,
+    so a failed equip never loses an item.
+    """
+    # item_data_dict is needed to look up the equipped item's effects
+    if character.get(slot):
+        _equipped_item_data(character[slot], item_data_dict)
+
+    inventory = character["inventory"]
+    position = inventory.index(item_id)
+    del inventory[position]
+    try:
+        unequip(character, item_data_dict)
+    except Exception:
+        inventory.insert(position, item_id)
+        raise
+
+def _apply_item_effects(character, effects, sign):
+    """Add (sign=1) or remove (sign=-1) equipment effects; missing stats count as 0"""
+    for stat, value in effects:
+        character[stat] = character.get(stat, 0) + sign * value
+
+def _equipped_item_data(item_id, item_data_dict):
+    """Look up an equipped item's data so its effects can be removed"""
+    if not item_data_dict or item_id not in item_data_dict:
+        raise ItemNotFoundError(f"No item data for equipped item '{item_id}'")
+    return item_data_dict[item_id]
   
 
 # ============================================================================
@@ -362,15 +391,33 @@ def parse_item_effect(effect_string):
     # TODO: Implement effect parsing
     if not effect_string or ":" not in effect_string:
         return None
-    # Split on ":"
     try:
-        stat_name, value_str = effect_string.split(':')
-        return stat_name, int(value_str)
-    except ValueError:
+        effects = parse_effect_string(effect_string)
+    except InvalidDataFormatError:
         # Handle cases where value isn't an integer
         return None
-    # Convert value to integer
-    pass
+    # Multi-stat strings only have their first effect returned here
+    return effects[0]
+
+def get_item_effects(item_data):
+    """
+    Get an item's effects as a tuple of (stat_name, value) pairs
+    
+    Uses the 'effects' field pre-parsed by game_data.load_items, and only
+    parses the raw 'effect' string for hand-built item dictionaries.
+    
+    Returns: Tuple of (stat_name, value) pairs (empty if none or invalid)
+    """
+    effects = item_data.get('effects')
+    if effects is not None:
+        return effects
+    effect_string = item_data.get('effect')
+    if not effect_string:
+        return ()
+    try:
+        return parse_effect_string(effect_string)
+    except InvalidDataFormatError:
+        return ()
 
 def apply_stat_effect(character, stat_name, value):
     """
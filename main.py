@@ -28,6 +28,12 @@ all_quests = {}
 all_items = {}
 game_running = False
 
+# Watchers used to hot reload edited data files
+data_watchers = {}
+
+# Write-behind autosave for the current character
+autosave = None
+
 # ============================================================================
 # MAIN MENU
 # ============================================================================
@@ -83,10 +89,9 @@ def new_game():
             print("Invalid class selection.")
     # Handle InvalidCharacterClassError
     try:
-        # Save character
+        current_character = character_manager.create_character(name, char_class)
         print(f"\nCharacter {name} the {char_class} created successfully!")
         
-        current_character = {"name": name, "class": char_class, "level": 1, "gold": 0} 
          # Start game loop
         game_loop()
         
@@ -140,16 +145,19 @@ def game_loop():
     """
     Main game loop - shows game menu and processes actions
     """
-    global game_running, current_character
+    global game_running, current_character, autosave
     print("\nWelcome to the Adventure!")
     
     game_running = True
+    autosave = character_manager.AutosaveCache().start()
     
     # TODO: Implement game loop
     # While game_running:
     # Display game menu
     # Execute chosen action
     while game_running:
+        # Pick up any edits designers made to the data files
+        reload_game_data()
         choice = game_menu()
          # Get player choice
         if choice == 1:
@@ -166,8 +174,13 @@ def game_loop():
             save_game()
             print("Thanks for playing!")
             game_running = False
-    #   Save game after each action
-    pass
+        #   Save game after each action
+        if game_running:
+            # Queued; the autosave thread writes it without blocking the menu
+            autosave.mark_dirty(current_character)
+    # The thread has stopped, so later saves must not go through this cache
+    report_save_errors(autosave.close())
+    autosave = None
 
 def game_menu():
     """
@@ -296,9 +309,9 @@ def view_inventory():
         try:
             t = item_data["type"]
             if t == "weapon":
-                print(inventory_system.equip_weapon(current_character, item_id, item_data))
+                print(inventory_system.equip_weapon(current_character, item_id, item_data, all_items))
             elif t == "armor":
-                print(inventory_system.equip_armor(current_character, item_id, item_data))
+                print(inventory_system.equip_armor(current_character, item_id, item_data, all_items))
             else:
                 print("This item cannot be equipped.")
         except Exception as e:
@@ -435,7 +448,11 @@ def shop():
         print(f"Your Gold: {current_character['gold']}")
         print("Items for Sale:")
 
-        item_list = list(all_items.items())
+        # Indexed catalogs list the shop cheapest first without sorting
+        if hasattr(all_items, 'ids_by_cost'):
+            item_list = [(item_id, all_items[item_id]) for item_id in all_items.ids_by_cost()]
+        else:
+            item_list = list(all_items.items())
         for index, (item_id, item) in enumerate(item_list, 1):
             print(f"{index}. {item['name']} ({item['type']}), Cost: {item['cost']} gold")
 
@@ -510,7 +527,14 @@ def save_game():
    
     try:
         # Use character_manager.save_character()
-        character_manager.save_character(current_character)
+        # Only the fields that changed are appended to the save journal
+        if autosave is not None:
+            autosave.mark_dirty(current_character)
+            for result in autosave.flush().values():
+                if isinstance(result, Exception):
+                    raise result
+        else:
+            character_manager.save_character_incremental(current_character)
         print("\nGame saved successfully!\n")
     # Handle any file I/O exceptions
     except Exception as e:
@@ -524,9 +548,12 @@ def load_game_data():
     # TODO: Implement data loading
     try:
         # Try to load quests with game_data.load_quests()
-        all_quests = game_data.load_quests()
+        # The compiled cache skips re-parsing files that haven't changed
+        all_quests = game_data.load_quest_catalog(use_cache=True)
         # Try to load items with game_data.load_items()
-        all_items = game_data.load_items()
+        # Loaded eagerly: the shop's cost index needs every item anyway, and
+        # bad item data must be reported here, not mid-game
+        all_items = game_data.load_item_catalog(use_cache=True)
     # Handle MissingDataFileError, InvalidDataFormatError
     except MissingDataFileError:
         print("[WARNING] Data files missing. Creating default files...")
@@ -534,8 +561,8 @@ def load_game_data():
         game_data.create_default_data_files()
 
         try:
-            all_quests = game_data.load_quests()
-            all_items = game_data.load_items()
+            all_quests = game_data.load_quest_catalog(use_cache=True)
+            all_items = game_data.load_item_catalog(use_cache=True)
         except Exception as e:
             print(f"[ERROR] Failed to load data even after creating defaults: {e}")
             all_quests = {}
@@ -550,15 +577,56 @@ def load_game_data():
         print(f"[ERROR] Unexpected error loading data: {e}")
         all_quests = {}
         all_items = {}
+
+    # Watch from the state just loaded, so no edit after this point is missed
+    start_data_watchers()
    
     pass
 
+def start_data_watchers():
+    """Snapshot the data files just loaded so later edits can be hot reloaded"""
+    global data_watchers
+
+    data_watchers = {}
+    for kind, filename in (("quests", "data/quests.txt"), ("items", "data/items.txt")):
+        try:
+            data_watchers[kind] = game_data.DataFileWatcher(filename, kind)
+        except DataError as e:
+            print(f"[ERROR] Could not watch {filename}: {e}")
+
+def reload_game_data():
+    """Apply edits to the data files in place, re-parsing only changed blocks"""
+    catalogs = {"quests": all_quests, "items": all_items}
+    for kind, watcher in data_watchers.items():
+        try:
+            diff = watcher.poll()
+            if diff:
+                game_data.apply_data_diff(catalogs[kind], diff)
+        except DataError as e:
+            print(f"[ERROR] Could not reload {watcher.filename}: {e}")
+            continue
+
+        if diff:
+            print(f"[INFO] Reloaded {kind}: {len(diff['added'])} added, "
+                  f"{len(diff['modified'])} modified, {len(diff['removed'])} removed")
+
+def report_save_errors(results):
+    """Print each failed save from an AutosaveCache flush result"""
+    for name, result in results.items():
+        if isinstance(result, Exception):
+            print(f"[ERROR] Failed to save {name}: {result}")
+
 def handle_character_death():
     """Handle character death"""
     global current_character, game_running
     
     # TODO: Implement death handling
     
+    # Make sure the state at death is on disk before anything else happens
+    if autosave is not None:
+        autosave.mark_dirty(current_character)
+        report_save_errors(autosave.flush())
+
     # Display death message
     print("\n===== YOU HAVE DIED =====")
     print("Want to revive? Choose an option:\n")
@@ -572,8 +640,9 @@ def handle_character_death():
         # If revive: use character_manager.revive_character()
 
         if choice == "1":
-            if current_character.gold >= 50:
-                current_character.gold -= 50
+            # Item access works for loaded dictionaries and new Characters
+            if current_character['gold'] >= 50:
+                current_character['gold'] -= 50
                 character_manager.revive_character(current_character)
                 print("\nYou have been revived!\n")
                 return
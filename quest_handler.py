@@ -171,6 +171,18 @@ def get_available_quests(character, quest_data_dict):
     # TODO: Implement available quest search
     # Filter all quests by requirements
     available = []
+
+    # Indexed catalogs only check quests whose prerequisite is met
+    if hasattr(quest_data_dict, 'children_of'):
+        candidates = quest_data_dict.children_of("NONE")
+        for completed_id in character.get('completed_quests', []):
+            candidates.extend(quest_data_dict.children_of(completed_id))
+        for q_id in candidates:
+            if can_accept_quest(character, q_id, quest_data_dict):
+                quest_info = quest_data_dict[q_id].copy()
+                quest_info['id'] = q_id
+                available.append(quest_info)
+        return available
     
     for q_id, q_data in quest_data_dict.items():
         # We can reuse our helper function 'can_accept_quest' here!
@@ -272,7 +284,7 @@ def get_quest_prerequisite_chain(quest_id, quest_data_dict):
         chain.append(prereq)
         current_id = prereq
     
-    chain.reverse[-1]
+    chain.reverse()
     
     return chain
     pass
@@ -329,6 +341,14 @@ def get_quests_by_level(quest_data_dict, min_level, max_level):
     """
     # TODO: Implement level filtering
     matching_quests = []
+
+    # Indexed catalogs look the range up directly
+    if hasattr(quest_data_dict, 'ids_by_level'):
+        for quest_id in quest_data_dict.ids_by_level(min_level, max_level):
+            q_copy = quest_data_dict[quest_id].copy()
+            q_copy['id'] = quest_id
+            matching_quests.append(q_copy)
+        return matching_quests
     
     for quest_id, quest_data in quest_data_dict.items():
         req_level = quest_data.get('required_level', 1)
@@ -437,10 +457,10 @@ def validate_quest_prerequisites(quest_data_dict):
         # Ignore if there is no prerequisite
         if prereq_id == "NONE":
             continue
-    # Ensure prerequisite exists in quest_data_dict
-    if prereq_id not in quest_data_dict:
+        # Ensure prerequisite exists in quest_data_dict
+        if prereq_id not in quest_data_dict:
             raise QuestNotFoundError(
-                "Invalid prerequisite was found")
+                f"Invalid prerequisite '{prereq_id}' found in quest '{quest_id}'")
             
     return True
     pass
@@ -0,0 +1,81 @@
+"""
+Test Character Record
+Tests for the slotted Character class returned by create_character
+"""
+
+import pytest
+import sys
+import os
+import pickle
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import inventory_system
+from custom_exceptions import *
+
+# ============================================================================
+# CHARACTER RECORD TESTS
+# ============================================================================
+
+def test_character_behaves_like_dict():
+    """Test the mapping interface other modules rely on"""
+    char = character_manager.create_character("SlotTest", "Warrior")
+    assert isinstance(char, character_manager.Character)
+    assert not hasattr(char, "__dict__")
+    assert char['class'] == "Warrior" and char.gold == 100
+    assert list(char) == list(character_manager.CHARACTER_FIELDS)
+    assert char == {"name": "SlotTest", "class": "Warrior", "level": 1, "health": 120,
+                    "max_health": 120, "strength": 15, "magic": 5, "experience": 0,
+                    "gold": 100, "inventory": [], "active_quests": [], "completed_quests": []}
+
+    char['gold'] += 5
+    char['equipped_weapon'] = "iron_sword"
+    assert char.get('equipped_weapon') == "iron_sword"
+    assert 'equipped_weapon' in char and 'equipped_armor' not in char
+    assert char.get('equipped_armor') is None
+    assert len(char) == 13
+
+    del char['equipped_weapon']
+    with pytest.raises(KeyError):
+        char['equipped_weapon']
+    assert pickle.loads(pickle.dumps(char)) == char
+
+def test_character_works_with_game_systems(tmp_path):
+    """Test that inventory functions and saves accept a Character"""
+    char = character_manager.create_character("SystemTest", "Mage")
+    inventory_system.add_item_to_inventory(char, "health_potion")
+    character_manager.gain_experience(char, 150)
+    assert char['level'] == 2
+
+    save_dir = str(tmp_path)
+    character_manager.save_character(char, save_dir)
+    loaded = character_manager.load_character("SystemTest", save_dir)
+    assert isinstance(loaded, character_manager.Character)
+    assert loaded == char
+
+# ============================================================================
+# BULK CREATION TESTS
+# ============================================================================
+
+def test_create_characters_matches_create_character():
+    """Test that bulk creation builds the same characters"""
+    specs = [(f"Npc{index}", character_manager.VALID_CHARACTER_CLASSES[index % 4])
+             for index in range(8)]
+    chars = character_manager.create_characters(specs)
+    assert chars == [character_manager.create_character(*spec) for spec in specs]
+    chars[0]['inventory'].append("health_potion")
+    assert chars[4]['inventory'] == []
+
+def test_create_characters_reports_every_bad_class():
+    """Test that one error lists all invalid entries and nothing is built"""
+    specs = [("Ok", "Mage"), ("Bad1", "Pirate"), ("Ok2", "Rogue"), ("Bad2", "ninja")]
+    with pytest.raises(InvalidCharacterClassError) as error:
+        character_manager.create_characters(specs)
+    message = str(error.value)
+    assert "2 invalid" in message
+    assert "'Bad1': 'Pirate'" in message and "'Bad2': 'ninja'" in message
+    assert "Ok" not in message.replace("Ok2", "")
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,447 @@
+"""
+Test Data Pipeline
+Tests for streaming, caching and indexed catalog loading
+"""
+
+import pytest
+import gzip
+import lzma
+import pickle
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+import quest_handler
+import content_generator
+from custom_exceptions import *
+
+QUEST_TEXT = """QUEST_ID: first_steps
+TITLE: First Steps
+DESCRIPTION: Begin your journey
+REWARD_XP: 50
+REWARD_GOLD: 25
+REQUIRED_LEVEL: 1
+PREREQUISITE: NONE
+
+QUEST_ID: goblin_problem
+TITLE: The Goblin Problem
+DESCRIPTION: Clear the goblin camp
+REWARD_XP: 100
+REWARD_GOLD: 50
+REQUIRED_LEVEL: 2
+PREREQUISITE: first_steps
+"""
+
+ITEM_TEXT = """ITEM_ID: health_potion
+NAME: Health Potion
+TYPE: consumable
+EFFECT: health:20
+COST: 25
+DESCRIPTION: Restores 20 health points
+
+ITEM_ID: iron_sword
+NAME: Iron Sword
+TYPE: weapon
+EFFECT: strength:5
+COST: 100
+DESCRIPTION: A sturdy iron sword
+"""
+
+@pytest.fixture
+def quest_file(tmp_path):
+    path = tmp_path / "quests.txt"
+    path.write_text(QUEST_TEXT)
+    return str(path)
+
+@pytest.fixture
+def item_file(tmp_path):
+    path = tmp_path / "items.txt"
+    path.write_text(ITEM_TEXT)
+    return str(path)
+
+# ============================================================================
+# STREAMING TESTS
+# ============================================================================
+
+def test_iter_quests_yields_records_in_order(quest_file):
+    """Test that iter_quests streams validated quests one block at a time"""
+    stream = game_data.iter_quests(quest_file)
+    first = next(stream)
+    assert first['quest_id'] == 'first_steps'
+    assert first['reward_xp'] == 50
+    assert [q['quest_id'] for q in stream] == ['goblin_problem']
+
+def test_load_items_matches_iter_items(item_file):
+    """Test that load_items is built on iter_items"""
+    items = game_data.load_items(item_file)
+    assert list(items) == [i['item_id'] for i in game_data.iter_items(item_file)]
+
+def test_iter_items_missing_file():
+    """Test that streaming a missing file raises MissingDataFileError"""
+    with pytest.raises(MissingDataFileError):
+        next(game_data.iter_items("nonexistent_items.txt"))
+
+def test_report_all_collects_every_error(tmp_path):
+    """Test that batch validation reports all bad blocks with line numbers"""
+    path = tmp_path / "items.txt"
+    bad_text = ITEM_TEXT.replace("COST: 25", "COST: lots").replace("TYPE: weapon", "TYPE: spell")
+    path.write_text(bad_text)
+
+    with pytest.raises(DataValidationError) as info:
+        game_data.load_items(str(path), report_all=True)
+    assert [line for line, message in info.value.errors] == [1, 8]
+    assert "Invalid item type: spell" in str(info.value)
+
+    # Without report_all the first problem is raised as before
+    with pytest.raises(InvalidDataFormatError):
+        game_data.load_items(str(path))
+
+# ============================================================================
+# COMPRESSED CATALOG TESTS
+# ============================================================================
+
+def test_compressed_catalogs_stream_like_plain_files(tmp_path, item_file):
+    """Test that .txt.gz and .txt.xz files load through the same parser"""
+    gz_path = str(tmp_path / "items.txt.gz")
+    xz_path = str(tmp_path / "items.txt.xz")
+    with gzip.open(gz_path, "wt") as f:
+        f.write(ITEM_TEXT)
+    with lzma.open(xz_path, "wt") as f:
+        f.write(ITEM_TEXT)
+
+    expected = game_data.load_items(item_file)
+    assert game_data.load_items(gz_path) == expected
+    assert game_data.load_items(xz_path) == expected
+    assert dict(game_data.load_items(xz_path, lazy=True).items()) == expected
+
+def test_lazy_compressed_catalog_decompresses_once(tmp_path, monkeypatch):
+    """Test that a full pass over a lazy .gz catalog opens the stream once"""
+    blocks = [ITEM_TEXT.replace("health_potion", f"potion_{i}").split("\n\n")[0]
+              for i in range(200)]
+    path = str(tmp_path / "items.txt.gz")
+    with gzip.open(path, "wt") as f:
+        f.write("\n\n".join(blocks) + "\n")
+
+    opens = []
+    real_open = game_data._open_data_file
+    def counting_open(filename, mode):
+        opens.append(filename)
+        return real_open(filename, mode)
+    monkeypatch.setattr(game_data, "_open_data_file", counting_open)
+
+    items = dict(game_data.load_items(path, lazy=True).items())
+    assert len(items) == 200
+    assert len(opens) == 1
+
+def test_truncated_compressed_catalog_is_corrupted(tmp_path):
+    """Test that a damaged compressed stream raises CorruptedDataError"""
+    path = tmp_path / "quests.txt.gz"
+    path.write_bytes(gzip.compress(QUEST_TEXT.encode() * 50)[:-40])
+    with pytest.raises(CorruptedDataError):
+        game_data.load_quests(str(path))
+
+# ============================================================================
+# LAZY CATALOG TESTS
+# ============================================================================
+
+def test_lazy_catalog_parses_on_first_access(item_file):
+    """Test that a LazyCatalog only parses the records that are used"""
+    items = game_data.load_items(item_file, lazy=True)
+    assert isinstance(items, game_data.LazyCatalog)
+    assert list(items) == ['health_potion', 'iron_sword']
+    assert items.parsed_count() == 0
+
+    assert items['iron_sword']['cost'] == 100
+    assert items.parsed_count() == 1
+    assert dict(items.items()) == game_data.load_items(item_file)
+
+def test_lazy_catalog_follows_edited_file(item_file):
+    """Test that unparsed records are still found after the file is edited"""
+    items = game_data.load_items(item_file, lazy=True)
+    with open(item_file, "w") as f:
+        f.write("\n\n\n" + ITEM_TEXT)
+    assert items['health_potion']['name'] == 'Health Potion'
+
+def test_lazy_catalog_drops_ids_removed_from_file(item_file):
+    """Test that a deleted block's old offset is never read as another block"""
+    items = game_data.load_items(item_file, lazy=True)
+    with open(item_file, "w") as f:
+        f.write(ITEM_TEXT.split("\n\n")[1])
+    with pytest.raises(KeyError):
+        items['health_potion']
+    assert 'health_potion' not in items
+    assert items['iron_sword']['name'] == 'Iron Sword'
+
+def test_hot_reload_delete_and_rename_on_lazy_catalog(item_file):
+    """Test that applying a diff never parses removed lazy records"""
+    items = game_data.load_item_catalog(item_file, lazy=True)
+    watcher = game_data.DataFileWatcher(item_file, "items")
+    with open(item_file, "w") as f:
+        f.write(ITEM_TEXT.split("\n\n")[1].replace("iron_sword", "steel_sword"))
+
+    game_data.apply_data_diff(items, watcher.poll())
+    assert sorted(items) == ['steel_sword']
+    assert items['steel_sword']['cost'] == 100
+
+def test_lazy_catalog_reports_bad_block_on_access(tmp_path):
+    """Test that validation errors surface when the bad record is accessed"""
+    path = tmp_path / "items.txt"
+    path.write_text(ITEM_TEXT.replace("COST: 100", "COST: free"))
+    items = game_data.load_items(str(path), lazy=True)
+
+    assert items['health_potion']['cost'] == 25
+    with pytest.raises(InvalidDataFormatError):
+        items['iron_sword']
+
+# ============================================================================
+# RECORD TYPE TESTS
+# ============================================================================
+
+def test_slotted_records_read_like_dicts(quest_file):
+    """Test that Quest records work with quest_handler unchanged"""
+    quests = game_data.load_quests(quest_file, as_records=True)
+    quest = quests['goblin_problem']
+
+    assert isinstance(quest, game_data.Quest)
+    assert not hasattr(quest, '__dict__')
+    assert quest['reward_gold'] == 50
+    assert quest.get('missing', 'default') == 'default'
+    assert quest == game_data.load_quests(quest_file)['goblin_problem']
+    assert pickle.loads(pickle.dumps(quest)) == quest
+
+    char = {'level': 2, 'active_quests': [], 'completed_quests': ['first_steps']}
+    available = quest_handler.get_available_quests(char, quests)
+    assert [q['id'] for q in available] == ['goblin_problem']
+
+# ============================================================================
+# CATALOG INDEX TESTS
+# ============================================================================
+
+def test_item_catalog_indexes(item_file):
+    """Test type and cost indexes, including updates after assignment"""
+    items = game_data.load_item_catalog(item_file)
+    assert items.ids_by_type('weapon') == ['iron_sword']
+    assert items.ids_by_cost() == ['health_potion', 'iron_sword']
+    assert items.ids_by_cost(min_cost=50) == ['iron_sword']
+
+    items['health_potion'] = dict(items['health_potion'], cost=500)
+    del items['iron_sword']
+    assert items.ids_by_cost(max_cost=100) == []
+    assert items.ids_by_type('weapon') == []
+
+def test_item_cost_index_bulk_build_is_sorted():
+    """Test that a one-sort bulk build and later inserts keep cost order"""
+    records = {f"item_{n}": {'type': 'weapon', 'cost': (n * 37) % 101} for n in range(500)}
+    items = game_data.ItemCatalog(records).build_indexes()
+    items['cheap'] = {'type': 'armor', 'cost': 0}
+    expected = sorted(items, key=lambda item_id: (items[item_id]['cost'], item_id))
+    assert items.ids_by_cost() == expected
+
+def test_quest_catalog_queries_match_scans(quest_file):
+    """Test that indexed quest queries give the same results as dict scans"""
+    plain = game_data.load_quests(quest_file)
+    catalog = game_data.load_quest_catalog(quest_file)
+    assert catalog.children_of('first_steps') == ['goblin_problem']
+
+    char = {'level': 2, 'active_quests': [], 'completed_quests': ['first_steps']}
+    assert (quest_handler.get_available_quests(char, catalog)
+            == quest_handler.get_available_quests(char, plain))
+    assert (quest_handler.get_quests_by_level(catalog, 2, 5)
+            == quest_handler.get_quests_by_level(plain, 2, 5))
+
+# ============================================================================
+# CACHE TESTS
+# ============================================================================
+
+def test_cache_written_and_reused(quest_file, monkeypatch):
+    """Test that a valid cache skips text parsing"""
+    quests = game_data.load_quests(quest_file, use_cache=True)
+    assert os.path.exists(quest_file + game_data.CACHE_SUFFIX)
+
+    def fail(*args):
+        raise AssertionError("cache hit should not parse")
+    monkeypatch.setattr(game_data, "parse_quest_block", fail)
+    assert game_data.load_quests(quest_file, use_cache=True) == quests
+
+def test_cache_invalidated_by_edit(item_file):
+    """Test that editing the source rebuilds the cache"""
+    game_data.load_items(item_file, use_cache=True)
+    with open(item_file, "a") as f:
+        f.write("\nITEM_ID: buckler\nNAME: Buckler\nTYPE: armor\n"
+                "EFFECT: max_health:5\nCOST: 40\nDESCRIPTION: A small shield\n")
+    items = game_data.load_items(item_file, use_cache=True)
+    assert 'buckler' in items
+
+# ============================================================================
+# INDEXED CATALOG TESTS
+# ============================================================================
+
+def test_mapped_catalog_random_access(item_file, tmp_path):
+    """Test that a compiled catalog can be looked up without a full load"""
+    items = game_data.load_items(item_file)
+    path = str(tmp_path / "items.qcat")
+    assert game_data.compile_catalog(items, path) == 2
+
+    with game_data.open_catalog(path) as catalog:
+        assert len(catalog) == 2
+        assert catalog['iron_sword'] == items['iron_sword']
+        assert 'dragon_scale' not in catalog
+        assert sorted(catalog) == sorted(items)
+
+def test_mapped_catalog_rejects_bad_file(tmp_path):
+    """Test that a file in another format raises CorruptedDataError"""
+    path = tmp_path / "bad.qcat"
+    path.write_bytes(b"not a catalog at all, definitely")
+    with pytest.raises(CorruptedDataError):
+        game_data.open_catalog(str(path))
+
+def _shared_item_cost(name, item_id):
+    """Worker helper: attach to a shared catalog and read one record"""
+    with game_data.attach_catalog(name) as catalog:
+        return catalog[item_id]['cost']
+
+def test_shared_catalog_attached_by_workers(item_file):
+    """Test that worker processes read a published catalog read-only"""
+    from concurrent.futures import ProcessPoolExecutor
+
+    items = game_data.load_items(item_file)
+    with game_data.publish_catalog(items) as published:
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            costs = list(pool.map(_shared_item_cost, [published.name] * 2,
+                                  ['health_potion', 'iron_sword']))
+        assert costs == [25, 100]
+
+        with game_data.attach_catalog(published.name) as catalog:
+            assert catalog['iron_sword'] == items['iron_sword']
+            with pytest.raises(TypeError):
+                catalog._view[0] = 0
+
+    with pytest.raises(MissingDataFileError):
+        game_data.attach_catalog(published.name)
+
+# ============================================================================
+# SHARD LOADING TESTS
+# ============================================================================
+
+def test_item_shards_merge_in_parallel(tmp_path):
+    """Test that shards load through a process pool into one catalog"""
+    blocks = ITEM_TEXT.split("\n\n")
+    for index, block in enumerate(blocks):
+        (tmp_path / f"shard_{index}.txt").write_text(block)
+
+    items = game_data.load_item_shards(str(tmp_path), max_workers=2)
+    assert sorted(items) == ['health_potion', 'iron_sword']
+
+def test_shards_report_duplicate_ids(tmp_path):
+    """Test that an ID defined in two shards raises InvalidDataFormatError"""
+    (tmp_path / "a.txt").write_text(QUEST_TEXT)
+    (tmp_path / "b.txt").write_text(QUEST_TEXT.split("\n\n")[0])
+
+    with pytest.raises(InvalidDataFormatError, match="first_steps"):
+        game_data.load_quest_shards(str(tmp_path), max_workers=1)
+
+def test_shard_errors_name_the_shard_and_keep_details():
+    """Test that a shard's error is re-raised with its path and details"""
+    def results():
+        raise DataValidationError("worker.txt", [(3, "Missing required quest field: title")])
+        yield
+
+    with pytest.raises(DataValidationError, match="shard_1.txt") as error:
+        game_data._merge_shards(["shard_1.txt"], results())
+    assert error.value.source == "shard_1.txt"
+    assert error.value.errors == [(3, "Missing required quest field: title")]
+
+    # Errors cross process boundaries when shards load in parallel
+    copy = pickle.loads(pickle.dumps(error.value))
+    assert copy.source == "shard_1.txt" and copy.errors == error.value.errors
+    assert str(copy) == str(error.value)
+
+def test_shards_missing_directory():
+    """Test that a directory without shards raises MissingDataFileError"""
+    with pytest.raises(MissingDataFileError):
+        game_data.load_quest_shards("nonexistent_shard_dir")
+
+# ============================================================================
+# HOT RELOAD TESTS
+# ============================================================================
+
+def test_watcher_reparses_only_changed_blocks(quest_file, monkeypatch):
+    """Test that poll() diffs blocks and apply_data_diff updates in place"""
+    quests = game_data.load_quests(quest_file)
+    watcher = game_data.DataFileWatcher(quest_file, "quests")
+    assert watcher.poll() is None
+
+    first_block, second_block = QUEST_TEXT.strip().split("\n\n")
+    new_block = first_block.replace("first_steps", "side_steps")
+    with open(quest_file, "w") as f:
+        f.write(first_block + "\n\n" + second_block.replace("REWARD_GOLD: 50", "REWARD_GOLD: 75")
+                + "\n\n" + new_block)
+
+    parsed = []
+    original_parse = game_data.parse_quest_block
+    monkeypatch.setattr(game_data, "parse_quest_block",
+                        lambda block: parsed.append(block) or original_parse(block))
+    diff = watcher.poll()
+
+    assert diff['added'] == ['side_steps']
+    assert diff['modified'] == ['goblin_problem']
+    assert diff['removed'] == []
+    assert len(parsed) == 2  # the unchanged first_steps block is skipped
+
+    game_data.apply_data_diff(quests, diff)
+    assert quests['goblin_problem']['reward_gold'] == 75
+    assert 'side_steps' in quests
+
+    with open(quest_file, "w") as f:
+        f.write(first_block)
+    diff = watcher.poll()
+    assert diff['removed'] == ['goblin_problem', 'side_steps']
+    game_data.apply_data_diff(quests, diff)
+    assert list(quests) == ['first_steps']
+
+# ============================================================================
+# COLUMNAR ANALYTICS TESTS
+# ============================================================================
+
+def test_item_columns_vectorized_queries(item_file):
+    """Test filtering, sorting and aggregating the columnar item view"""
+    pytest.importorskip("numpy")
+    import catalog_analytics
+
+    columns = catalog_analytics.build_item_columns(game_data.load_items(item_file))
+    assert columns.filter(item_type="weapon") == ['iron_sword']
+    assert columns.filter(effect_stat="health", max_cost=50) == ['health_potion']
+    assert columns.sort_by("cost", descending=True) == ['iron_sword', 'health_potion']
+    assert columns.cost_summary()['total'] == 125
+    assert columns.cost_by_type()['consumable']['count'] == 1
+
+# ============================================================================
+# CONTENT GENERATOR TESTS
+# ============================================================================
+
+def test_generated_pack_is_valid_and_reproducible(tmp_path):
+    """Test that generated files load, respect depth/fan-out, and are seeded"""
+    quest_path, item_path = str(tmp_path / "q.txt"), str(tmp_path / "i.txt")
+    content_generator.generate_content_pack(quest_path, item_path, 300, 200,
+                                            seed=7, max_depth=4, fan_out=2)
+    quests = game_data.load_quests(quest_path)
+    items = game_data.load_items(item_path)
+    assert len(quests) == 300 and len(items) == 200
+    assert quest_handler.validate_quest_prerequisites(quests)
+
+    catalog = game_data.QuestCatalog(quests)
+    for quest_id in quests:
+        chain = quest_handler.get_quest_prerequisite_chain(quest_id, quests)
+        assert chain[-1] == quest_id and len(chain) <= 4
+        assert len(catalog.children_of(quest_id)) <= 2
+
+    with open(quest_path) as first:
+        content_generator.generate_content_pack(quest_path + "2", item_path + "2", 300, 200,
+                                                seed=7, max_depth=4, fan_out=2)
+        with open(quest_path + "2") as second:
+            assert first.read() == second.read()
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
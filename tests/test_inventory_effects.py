@@ -0,0 +1,106 @@
+"""
+Test Inventory Effects
+Tests that inventory functions use effects pre-parsed at load time
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import inventory_system
+import game_data
+from custom_exceptions import *
+
+ITEMS = {
+    'elixir': {'item_id': 'elixir', 'type': 'consumable', 'effect': 'health:10,magic:2',
+               'effects': (('health', 10), ('magic', 2))},
+    'iron_sword': {'item_id': 'iron_sword', 'type': 'weapon', 'effect': 'strength:5',
+                   'effects': (('strength', 5),)},
+    'steel_sword': {'item_id': 'steel_sword', 'type': 'weapon', 'effect': 'strength:10',
+                    'effects': (('strength', 10),)},
+}
+
+def test_load_items_pre_parses_effects():
+    """Test that load_items stores effects as (stat, value) pairs"""
+    items = game_data.load_items("data/items.txt")
+    assert items['health_potion']['effects'] == (('health', 20),)
+    assert game_data.parse_effect_string("strength:5, magic:-3") == (('strength', 5), ('magic', -3))
+    assert game_data.parse_effect_string("health:+5") == (('health', 5),)
+    with pytest.raises(InvalidDataFormatError):
+        game_data.parse_effect_string("strength")
+
+def test_unparseable_effect_loads_and_fails_on_use(tmp_path):
+    """Test that a bad EFFECT doesn't fail the load but can't be used"""
+    path = tmp_path / "items.txt"
+    path.write_text("ITEM_ID: odd_tonic\nNAME: Odd Tonic\nTYPE: consumable\n"
+                    "EFFECT: none\nCOST: 5\nDESCRIPTION: Smells odd\n")
+    items = game_data.load_items(str(path))
+    assert items['odd_tonic']['effects'] == ()
+
+    char = character_manager.create_character("TonicTest", "Mage")
+    inventory_system.add_item_to_inventory(char, 'odd_tonic')
+    result = inventory_system.use_item(char, 'odd_tonic', items['odd_tonic'])
+    assert result == "Item odd_tonic has invalid effect data."
+    assert 'odd_tonic' in char['inventory']
+
+def test_use_item_applies_every_effect():
+    """Test that a multi-stat consumable applies all its effects"""
+    char = character_manager.create_character("EffectTest", "Mage")
+    char['health'] = 50
+    inventory_system.add_item_to_inventory(char, 'elixir')
+
+    inventory_system.use_item(char, 'elixir', ITEMS['elixir'])
+    assert char['health'] == 60
+    assert char['magic'] == 22
+
+def test_swapping_weapons_uses_catalog_effects():
+    """Test that equipping over a weapon removes the old weapon's bonus"""
+    char = character_manager.create_character("SwapTest", "Warrior")
+    base_strength = char['strength']
+    char['inventory'] += ['iron_sword', 'steel_sword']
+
+    inventory_system.equip_weapon(char, 'iron_sword', ITEMS['iron_sword'], ITEMS)
+    inventory_system.equip_weapon(char, 'steel_sword', ITEMS['steel_sword'], ITEMS)
+
+    assert char['strength'] == base_strength + 10
+    assert char['equipped_weapon'] == 'steel_sword'
+    assert char['inventory'] == ['iron_sword']
+
+    assert inventory_system.unequip_weapon(char, ITEMS) == 'steel_sword'
+    assert char['strength'] == base_strength
+
+def test_weapon_swap_on_minimal_character_keeps_both_weapons():
+    """Test swapping weapons on a character without a strength stat"""
+    char = {"name": "Minimal", "class": "Warrior", "level": 1, "gold": 0,
+            "inventory": ['iron_sword', 'steel_sword'], "equipped_weapon": None}
+
+    inventory_system.equip_weapon(char, 'iron_sword', ITEMS['iron_sword'], ITEMS)
+    inventory_system.equip_weapon(char, 'steel_sword', ITEMS['steel_sword'], ITEMS)
+    assert char['equipped_weapon'] == 'steel_sword'
+    assert char['inventory'] == ['iron_sword']
+    assert char['strength'] == 10
+
+    inventory_system.unequip_weapon(char, ITEMS)
+    assert char['strength'] == 0
+    assert sorted(char['inventory']) == ['iron_sword', 'steel_sword']
+
+def test_failed_weapon_swap_loses_nothing():
+    """Test that a swap whose unequip fails leaves the inventory untouched"""
+    char = character_manager.create_character("SwapFail", "Warrior")
+    char['inventory'] = ['iron_sword', 'steel_sword']
+    inventory_system.equip_weapon(char, 'iron_sword', ITEMS['iron_sword'], ITEMS)
+
+    def failing_unequip(character, item_data_dict=None):
+        raise InventoryFullError("no room")
+
+    with pytest.raises(InventoryFullError):
+        inventory_system._take_from_inventory_for_swap(
+            char, 'steel_sword', "equipped_weapon", failing_unequip, ITEMS)
+    assert char['inventory'] == ['steel_sword']
+    assert char['equipped_weapon'] == 'iron_sword'
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
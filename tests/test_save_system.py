@@ -0,0 +1,445 @@
+"""
+Test Save System
+Tests for character save/load storage and performance features
+"""
+
+import pytest
+import sys
+import os
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+from custom_exceptions import *
+
+@pytest.fixture
+def save_dir(tmp_path):
+    return str(tmp_path / "save_games")
+
+@pytest.fixture
+def save_db(tmp_path):
+    yield str(tmp_path / "saves.db")
+    character_manager.close_character_stores()
+
+# ============================================================================
+# ATOMIC SAVE TESTS
+# ============================================================================
+
+def test_save_is_atomic_and_leaves_no_temp_files(save_dir):
+    """Test that saving replaces the file in one step"""
+    char = character_manager.create_character("AtomicTest", "Cleric")
+    assert character_manager.save_character(char, save_dir, fsync=True) == True
+    char['gold'] = 999
+    character_manager.save_character(char, save_dir)
+
+    assert sorted(os.listdir(save_dir)) == ["AtomicTest_save.bin", "manifest.tsv"]
+    assert character_manager.load_character("AtomicTest", save_dir)['gold'] == 999
+
+def test_failed_save_raises_and_keeps_old_file(save_dir, monkeypatch):
+    """Test that a failed write reports an error and keeps the previous save"""
+    char = character_manager.create_character("CrashTest", "Rogue")
+    character_manager.save_character(char, save_dir)
+
+    def crash(src, dst):
+        raise OSError("disk full")
+    monkeypatch.setattr(character_manager.os, "replace", crash)
+    char['gold'] = 5
+    with pytest.raises(SaveFileWriteError):
+        character_manager.save_character(char, save_dir)
+
+    monkeypatch.undo()
+    assert sorted(os.listdir(save_dir)) == ["CrashTest_save.bin", "manifest.tsv"]
+    assert character_manager.load_character("CrashTest", save_dir)['gold'] == 100
+
+@pytest.mark.skipif(not hasattr(os, "fchmod"), reason="no POSIX file modes")
+def test_atomic_write_uses_normal_file_modes(save_dir, monkeypatch):
+    """Test that new saves follow the umask and rewrites keep the file's mode"""
+    monkeypatch.setattr(character_manager, "_NEW_FILE_MODE", 0o666 & ~0o022)
+    char = character_manager.create_character("ModeTest", "Cleric")
+    character_manager.save_character(char, save_dir)
+    path = os.path.join(save_dir, "ModeTest_save.bin")
+    assert os.stat(path).st_mode & 0o777 == 0o644
+
+    os.chmod(path, 0o640)
+    character_manager.save_character(char, save_dir)
+    assert os.stat(path).st_mode & 0o777 == 0o640
+
+# ============================================================================
+# BINARY SAVE FORMAT TESTS
+# ============================================================================
+
+def test_binary_save_round_trips_types(save_dir):
+    """Test that the binary format keeps types the text format had to guess"""
+    char = character_manager.create_character("BinaryTest", "Mage")
+    char['inventory'] = ["health_potion"]
+    char['completed_quests'] = []
+    char['gold'] = -5
+    char['equipped_weapon'] = None
+    char['title'] = "Arch, Mage: 42"
+    character_manager.save_character(char, save_dir)
+
+    assert character_manager.load_character("BinaryTest", save_dir) == char
+
+def test_legacy_text_save_still_loads(save_dir):
+    """Test that text saves load and are replaced by a binary save"""
+    char = character_manager.create_character("LegacyTest", "Warrior")
+    character_manager.save_character(char, save_dir, save_format="text")
+    loaded = character_manager.load_character("LegacyTest", save_dir)
+    assert loaded['gold'] == 100 and loaded['class'] == "Warrior"
+
+    character_manager.save_character(loaded, save_dir)
+    assert sorted(os.listdir(save_dir)) == ["LegacyTest_save.bin", "manifest.tsv"]
+    assert character_manager.list_saved_characters(save_dir) == ["LegacyTest"]
+    character_manager.delete_character("LegacyTest", save_dir)
+    assert character_manager.list_saved_characters(save_dir) == []
+
+def test_binary_save_is_smaller_than_text():
+    """Test that known fields and small numbers are stored compactly"""
+    char = character_manager.create_character("SizeTest", "Warrior")
+    binary = character_manager.encode_binary_save(char)
+    text = character_manager._serialize_character(char).encode("utf-8")
+    assert len(binary) * 2 < len(text)
+
+    # Extra keys, big numbers and an empty string still round-trip
+    char['equipped_weapon'] = ""
+    char['gold'] = 2 ** 40
+    assert character_manager.decode_binary_save(character_manager.encode_binary_save(char)) == char
+
+def test_version_1_binary_save_still_loads():
+    """Test that saves written before the compact format still decode"""
+    v1 = bytes.fromhex(
+        "51435341564501080003000000dd153a2c020201010600030401000000010000000100"
+        "000001000000020000000000000001000000010000000300000000000000fbffffffff"
+        "ffffff01000000000000006e616d6500636c617373006c6576656c00676f6c6400696e"
+        "76656e746f72790065717569707065645f776561706f6e00666c616700726174696f00"
+        "4f6c64004d6167650061006200302e35")
+    assert character_manager.decode_binary_save(v1) == {
+        'name': 'Old', 'class': 'Mage', 'level': 3, 'gold': -5, 'inventory': ['a', 'b'],
+        'equipped_weapon': None, 'flag': True, 'ratio': 0.5}
+
+def test_damaged_binary_save_raises(save_dir):
+    """Test that truncated or unknown-version saves are reported"""
+    char = character_manager.create_character("DamageTest", "Rogue")
+    data = character_manager.encode_binary_save(char)
+
+    with pytest.raises(SaveFileCorruptedError):
+        character_manager.decode_binary_save(data[:-3])
+    future = data[:6] + bytes([99]) + data[7:]
+    with pytest.raises(InvalidSaveDataError):
+        character_manager.decode_binary_save(future)
+
+# ============================================================================
+# SAVE JOURNAL TESTS
+# ============================================================================
+
+def test_incremental_saves_append_deltas_and_replay(save_dir):
+    """Test that small changes go to the journal and load replays them"""
+    char = character_manager.create_character("JournalTest", "Warrior")
+    # Enough history that a delta is clearly cheaper than a new snapshot
+    char['completed_quests'] = [f"quest_{n}" for n in range(20)]
+    character_manager.save_character_incremental(char, save_dir)
+    snapshot = os.path.join(save_dir, "JournalTest_save.bin")
+    journal = os.path.join(save_dir, "JournalTest_save.journal")
+    snapshot_bytes = open(snapshot, "rb").read()
+    assert not os.path.exists(journal)
+
+    char['gold'] += 50
+    char['inventory'].append("health_potion")
+    character_manager.save_character_incremental(char, save_dir)
+    char['inventory'].remove("health_potion")
+    char['active_quests'].append("first_steps")
+    char['experience'] = 40
+    character_manager.save_character_incremental(char, save_dir)
+
+    assert open(snapshot, "rb").read() == snapshot_bytes
+    assert os.path.getsize(journal) < len(snapshot_bytes)
+    assert character_manager.load_character("JournalTest", save_dir) == char
+
+    character_manager.delete_character("JournalTest", save_dir)
+    assert not os.path.exists(journal)
+
+def test_journal_compacts_and_ignores_torn_or_stale_records(save_dir, monkeypatch):
+    """Test compaction, a torn final append and a journal from an old snapshot"""
+    monkeypatch.setattr(character_manager, "JOURNAL_COMPACT_RECORDS", 3)
+    char = character_manager.create_character("CompactTest", "Mage")
+    journal = os.path.join(save_dir, "CompactTest_save.journal")
+    for gold in range(1, 6):
+        char['gold'] = gold
+        character_manager.save_character_incremental(char, save_dir)
+    # Snapshot, three deltas, then the fifth save compacts
+    assert not os.path.exists(journal)
+    assert character_manager.load_character("CompactTest", save_dir)['gold'] == 5
+
+    char['gold'] = 6
+    character_manager.save_character_incremental(char, save_dir)
+    stale_journal = open(journal, "rb").read()
+    with open(journal, "ab") as f:
+        f.write(b"\x40\x00\x00\x00QCSA")
+    assert character_manager.load_character("CompactTest", save_dir)['gold'] == 6
+
+    char['gold'] = 7
+    character_manager.save_character(char, save_dir)
+    # As if compaction crashed before removing the old journal
+    with open(journal, "wb") as f:
+        f.write(stale_journal)
+    assert character_manager.load_character("CompactTest", save_dir)['gold'] == 7
+
+# ============================================================================
+# AUTOSAVE TESTS
+# ============================================================================
+
+def test_autosave_coalesces_and_flushes(save_dir):
+    """Test that repeated changes to one character become one save"""
+    cache = character_manager.AutosaveCache(save_dir, interval=60)
+    char = character_manager.create_character("AutoTest", "Rogue")
+    for gold in range(10):
+        char['gold'] = gold
+        cache.mark_dirty(char)
+    char['gold'] = 1000    # After marking; must not leak into the queued copy
+
+    assert cache.pending() == ["AutoTest"]
+    assert cache.flush() == {"AutoTest": True}
+    assert cache.saves == 1 and cache.pending() == []
+    assert character_manager.load_character("AutoTest", save_dir)['gold'] == 9
+
+def test_autosave_background_thread_and_failures(save_dir):
+    """Test threshold-triggered background flushes and retry of failed saves"""
+    saved = []
+    flushed = threading.Event()
+    def fake_save(character, save_directory):
+        if character['name'] == "Broken":
+            raise SaveFileWriteError("disk full")
+        saved.append(character['name'])
+        flushed.set()
+        return True
+
+    cache = character_manager.AutosaveCache(save_dir, interval=60, max_dirty=2, save=fake_save)
+    with cache:
+        cache.mark_dirty(character_manager.create_character("One", "Mage"))
+        cache.mark_dirty(character_manager.create_character("Broken", "Mage"))
+        assert flushed.wait(5)
+    assert saved == ["One"]
+    assert isinstance(cache.errors["Broken"], SaveFileWriteError)
+    assert cache.pending() == ["Broken"]
+
+def test_autosave_survives_unexpected_errors(save_dir):
+    """Test that a non-game error is re-queued and the thread keeps running"""
+    saved = []
+    flushed = threading.Event()
+    def flaky_save(character, save_directory):
+        if character['name'] == "Flaky" and not saved:
+            raise OSError("device gone")
+        saved.append(character['name'])
+        flushed.set()
+        return True
+
+    cache = character_manager.AutosaveCache(save_dir, interval=60, max_dirty=1, save=flaky_save)
+    with cache:
+        cache.mark_dirty(character_manager.create_character("Flaky", "Mage"))
+        cache.mark_dirty(character_manager.create_character("Steady", "Mage"))
+        assert flushed.wait(5)
+        assert cache._thread.is_alive()
+    assert "Steady" in saved and "Flaky" in saved
+    assert cache.pending() == []
+
+# ============================================================================
+# LOAD CACHE TESTS
+# ============================================================================
+
+@pytest.fixture
+def load_cache():
+    yield character_manager.enable_load_cache(max_entries=2)
+    character_manager.disable_load_cache()
+
+def test_load_cache_hits_and_copies_on_read(save_dir, load_cache):
+    """Test that repeated loads hit the cache and can't corrupt it"""
+    char = character_manager.create_character("CacheTest", "Cleric")
+    character_manager.save_character(char, save_dir)
+    load_cache.clear()
+
+    first = character_manager.load_character("CacheTest", save_dir)
+    first['inventory'].append("stolen_item")
+    first['gold'] = 0
+    second = character_manager.load_character("CacheTest", save_dir)
+    assert second == char
+    assert character_manager.load_cache_stats() == {'hits': 1, 'misses': 1, 'size': 1, 'max_entries': 2}
+
+def test_load_cache_invalidation_and_eviction(save_dir, load_cache):
+    """Test invalidation by saves, deletes, file edits and LRU eviction"""
+    char = character_manager.create_character("CacheTest", "Cleric")
+    character_manager.save_character(char, save_dir)
+    character_manager.load_character("CacheTest", save_dir)
+
+    char['gold'] = 7
+    character_manager.save_character(char, save_dir)
+    assert character_manager.load_character("CacheTest", save_dir)['gold'] == 7
+
+    # Another process rewriting the file is caught by the stat check
+    other = dict(char, gold=8)
+    path = os.path.join(save_dir, "CacheTest_save.bin")
+    with open(path, "wb") as f:
+        f.write(character_manager.encode_binary_save(other))
+    assert character_manager.load_character("CacheTest", save_dir)['gold'] == 8
+
+    for name in ("A", "B"):
+        character_manager.save_character(character_manager.create_character(name, "Mage"), save_dir)
+        character_manager.load_character(name, save_dir)
+    assert load_cache.stats()['size'] == 2
+
+    character_manager.delete_character("A", save_dir)
+    with pytest.raises(CharacterNotFoundError):
+        character_manager.load_character("A", save_dir)
+
+# ============================================================================
+# BULK LOAD/SAVE TESTS
+# ============================================================================
+
+@pytest.mark.parametrize("target", ["save_dir", "save_db"])
+def test_bulk_save_and_load_report_per_character(target, request):
+    """Test that one bad save doesn't abort the rest of the batch"""
+    path = request.getfixturevalue(target)
+    chars = [character_manager.create_character(f"Bulk{index}", "Mage") for index in range(20)]
+    results = character_manager.save_characters(chars, path, max_workers=4)
+    assert list(results.values()) == [True] * 20
+
+    names = ["Bulk3", "Missing", "Bulk7"]
+    loaded = character_manager.load_characters(names, path, max_workers=4)
+    assert list(loaded) == names
+    assert loaded["Bulk3"] == chars[3]
+    assert loaded["Bulk7"]['name'] == "Bulk7"
+    assert isinstance(loaded["Missing"], CharacterNotFoundError)
+
+def test_bulk_save_reports_bad_character(save_dir):
+    """Test that an unsavable character is returned as its exception"""
+    good = character_manager.create_character("Good", "Rogue")
+    bad = character_manager.create_character("Bad", "Rogue")
+    bad['inventory'] = [object()]
+    results = character_manager.save_characters([good, bad], save_dir)
+    assert results["Good"] == True
+    assert isinstance(results["Bad"], InvalidSaveDataError)
+
+def test_bulk_load_keeps_unexpected_errors_per_character(save_dir, monkeypatch):
+    """Test that a non-game exception for one name doesn't lose the batch"""
+    character_manager.save_characters(
+        [character_manager.create_character(name, "Mage") for name in ("Ok", "Boom")], save_dir)
+    real_load = character_manager.load_character
+    def flaky_load(name, save_directory):
+        if name == "Boom":
+            raise RuntimeError("unexpected")
+        return real_load(name, save_directory)
+    monkeypatch.setattr(character_manager, "load_character", flaky_load)
+
+    loaded = character_manager.load_characters(["Ok", "Boom"], save_dir, max_workers=2)
+    assert loaded["Ok"]['name'] == "Ok"
+    assert isinstance(loaded["Boom"], RuntimeError)
+
+def test_unremovable_old_save_is_a_save_error(save_dir):
+    """Test that failing to remove the other-format save reports SaveFileWriteError"""
+    os.makedirs(os.path.join(save_dir, "B_save.txt"))
+    chars = [character_manager.create_character(name, "Rogue") for name in "ABC"]
+    results = character_manager.save_characters(chars, save_dir)
+    assert results["A"] == True and results["C"] == True
+    assert isinstance(results["B"], SaveFileWriteError)
+
+# ============================================================================
+# SAVE MANIFEST TESTS
+# ============================================================================
+
+def test_manifest_pages_and_sorts_without_reading_saves(save_dir):
+    """Test paginated listing served from the manifest"""
+    for index, name in enumerate(["Cara", "Abe", "Dom", "Bea"]):
+        char = character_manager.create_character(name, "Warrior")
+        char['level'] = 10 - index
+        character_manager.save_character(char, save_dir)
+    character_manager.delete_character("Dom", save_dir)
+    # Summaries must come from the manifest, not from the save files
+    os.remove(os.path.join(save_dir, "Abe_save.bin"))
+
+    assert character_manager.list_saved_characters(save_dir) == ["Abe", "Bea", "Cara"]
+    assert character_manager.list_saved_characters(save_dir, offset=1, limit=1) == ["Bea"]
+    assert character_manager.list_saved_characters(save_dir, sort_by="-level") == ["Cara", "Abe", "Bea"]
+    summary = character_manager.get_save_summaries(save_dir, limit=1)[0]
+    assert (summary['name'], summary['class'], summary['level']) == ("Abe", "Warrior", 9)
+    with pytest.raises(ValueError):
+        character_manager.list_saved_characters(save_dir, sort_by="gold")
+
+    assert character_manager.rebuild_save_manifest(save_dir) == 2
+    assert character_manager.list_saved_characters(save_dir) == ["Bea", "Cara"]
+
+def test_manifest_compacts_and_is_rebuilt_when_missing(save_dir, monkeypatch):
+    """Test manifest compaction and automatic rebuild"""
+    monkeypatch.setattr(character_manager, "MANIFEST_COMPACT_SLACK", 0)
+    char = character_manager.create_character("Grinder", "Rogue")
+    for gold in range(20):
+        char['gold'] = gold
+        character_manager.save_character(char, save_dir)
+    manifest_path = os.path.join(save_dir, character_manager.MANIFEST_FILENAME)
+    with open(manifest_path) as f:
+        assert len(f.readlines()) <= 2
+
+    os.remove(manifest_path)
+    assert character_manager.list_saved_characters(save_dir) == ["Grinder"]
+    assert os.path.exists(manifest_path)
+
+def test_manifest_errors_raise_save_errors(save_dir):
+    """Test that manifest I/O failures and bad names are reported as save errors"""
+    os.makedirs(os.path.join(save_dir, character_manager.MANIFEST_FILENAME))
+    char = character_manager.create_character("M", "Mage")
+    with pytest.raises(SaveFileWriteError):
+        character_manager.save_character(char, save_dir)
+    with pytest.raises(SaveFileWriteError):
+        character_manager.list_saved_characters(save_dir)
+
+    tabbed = character_manager.create_character("Bad\tName", "Mage")
+    with pytest.raises(InvalidSaveDataError):
+        character_manager.save_character(tabbed, save_dir)
+    assert "Bad\tName_save.bin" not in os.listdir(save_dir)
+
+# ============================================================================
+# SQLITE STORE TESTS
+# ============================================================================
+
+def test_sqlite_store_uses_same_functions(save_db):
+    """Test save/load/list/delete against a SQLite database path"""
+    char = character_manager.create_character("SqlTest", "Mage")
+    char['inventory'] = ["health_potion"]
+    assert character_manager.save_character(char, save_db) == True
+
+    assert character_manager.load_character("SqlTest", save_db) == char
+    assert character_manager.list_saved_characters(save_db) == ["SqlTest"]
+    store = character_manager.get_character_store(save_db)
+    assert store.connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    character_manager.delete_character("SqlTest", save_db)
+    with pytest.raises(CharacterNotFoundError):
+        character_manager.load_character("SqlTest", save_db)
+    with pytest.raises(CharacterNotFoundError):
+        character_manager.delete_character("SqlTest", save_db)
+
+def test_sqlite_batched_transaction_and_queries(save_db):
+    """Test that a batch commits together and filters are queries"""
+    with character_manager.save_transaction(save_db):
+        for index, char_class in enumerate(["Warrior", "Mage", "Warrior", "Rogue"]):
+            char = character_manager.create_character(f"Hero{index}", char_class)
+            char['level'] = index + 1
+            character_manager.save_character(char, save_db)
+
+    assert character_manager.find_saved_characters(save_db, "Warrior") == ["Hero0", "Hero2"]
+    assert character_manager.find_saved_characters(save_db, min_level=2, max_level=3) == ["Hero1", "Hero2"]
+
+    with pytest.raises(RuntimeError):
+        with character_manager.save_transaction(save_db):
+            character_manager.delete_character("Hero0", save_db)
+            raise RuntimeError("abort batch")
+    assert len(character_manager.list_saved_characters(save_db)) == 4
+    assert character_manager.list_saved_characters(save_db, offset=1, limit=2, sort_by="-level") == ["Hero2", "Hero1"]
+
+def test_find_saved_characters_in_directory(save_dir):
+    """Test that filtering also works for a save directory"""
+    for name, char_class in [("Ann", "Cleric"), ("Bob", "Mage")]:
+        character_manager.save_character(character_manager.create_character(name, char_class), save_dir)
+    assert character_manager.find_saved_characters(save_dir, "Mage") == ["Bob"]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])